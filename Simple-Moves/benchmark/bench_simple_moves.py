@@ -0,0 +1,322 @@
+"""
+Samplistic Simple Moves - Benchmark
+Author: Delek Miller | Samplistic
+Description: Times the Simple Moves evaluation outside Cinema 4D. The core
+in simple-moves-plugin runs against the pure-Python c4d stand-ins in
+standin/, and every case reports microseconds per evaluation of one driven
+object, each frame's best of several sweeps, with warm target caches. The
+"scrub" cases revisit the same frames with the frame memo on (the
+"scrub-default" ones with Scale off, as a new tag has it), the
+"constant-speed" cases look the slider up by arc length, the "clones"
+cases read the targets from a MoGraph generator, the "subframes" cases
+time motion blur samples taken eight at a time, the "eased" cases add
+an easing curve, the "tcb" cases use TCB interpolation with a TCB tag
+on every third target and the "batch" cases evaluate all slider positions
+with one simple_moves_batch.evaluate_path() call (with NumPy if it is
+installed).
+
+The stand-in Vector and Matrix are far slower than the real ones, so the
+numbers are only comparable between runs on the same machine. They are
+meant for catching a change that makes the tag slower, not for predicting
+frame times in Cinema 4D. Save the baselines on a quiet machine and raise
+--tolerance on shared or throttling ones.
+
+Usage:
+    python bench_simple_moves.py              run every case and print a table
+    python bench_simple_moves.py --save       also store the results as baselines.json
+    python bench_simple_moves.py --check      compare with baselines.json, exit 1 on a regression
+    python bench_simple_moves.py --quick      fewer target counts and repeats
+
+Python version 3.11.4
+"""
+
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, "standin"))
+sys.path.insert(1, os.path.join(BENCH_DIR, "..", "simple-moves-plugin"))
+
+import c4d # noqa: E402
+from c4d import utils as u # noqa: E402
+from c4d.modules import mograph # noqa: E402
+
+import simple_moves_core as core # noqa: E402
+import simple_moves_batch as batch # noqa: E402
+
+
+BASELINES_PATH = os.path.join(BENCH_DIR, "baselines.json")
+
+TARGET_COUNTS = (2, 10, 100, 1000)
+QUICK_TARGET_COUNTS = (2, 100)
+
+# Name, interpolation, softness
+INTERPOLATIONS = (
+    ("linear", core.INTERP_LINEAR, 0.0),
+    ("soft-0.25", core.INTERP_SOFT, 0.25),
+    ("soft-0.5", core.INTERP_SOFT, 0.5),
+    ("soft-1.0", core.INTERP_SOFT, 1.0),
+)
+
+# Name, Settings keywords
+ROTATIONS = (
+    ("basic", {}),
+    ("shortest", {"shortest": True}),
+    ("quaternion", {"quaternion": True}),
+)
+
+# Slider positions per repeat, spread over the whole path
+STEPS = 200
+
+# Relative slowdown that counts as a regression in --check
+TOLERANCE = 0.25
+
+
+def make_targets(count, doc=None):
+    """Targets on a wobbly loop, each with its own rotation and scale."""
+    targets = []
+    for k in range(count):
+        a = 2.0 * math.pi * k / count
+        pos = c4d.Vector(400.0 * math.cos(a), 60.0 * math.sin(3.0 * a), 400.0 * math.sin(a))
+        m = u.HPBToMatrix(c4d.Vector(a, 0.3 * math.sin(a), 0.2 * math.cos(2.0 * a)))
+        scale = 1.0 + 0.5 * math.sin(a)
+        m = c4d.Matrix(pos, m.v1 * scale, m.v2 * scale, m.v3 * scale)
+        targets.append(c4d.BaseObject(m, doc=doc))
+    return targets
+
+
+def add_tcb_tags(targets):
+    for k in range(0, len(targets), 3):
+        tag = c4d.BaseTag(core.TCB_TAG_ID)
+        tag[c4d.SIMPLEMOVES_TCB_TENSION] = 0.5 * math.sin(k)
+        tag[c4d.SIMPLEMOVES_TCB_CONTINUITY] = 0.3 * math.cos(k)
+        tag[c4d.SIMPLEMOVES_TCB_BIAS] = 0.2
+        targets[k].InsertTag(tag)
+
+
+def make_settings(interpolation, softness, rotation, easing=None, scale=True, constant_speed=False):
+    return [core.Settings(mode=core.MODE_TOTAL, total=step / (STEPS - 1.0),
+                          position=True, scale=scale, rotation=True,
+                          interpolation=interpolation, softness=softness,
+                          easing=easing, constant_speed=constant_speed, **rotation)
+            for step in range(STEPS)]
+
+
+def make_easing():
+    """Smoothstep ease-in/ease-out, the shape of the default Easing curve."""
+    size = core.EasingTable.SIZE
+    return core.EasingTable((x * x * (3.0 - 2.0 * x)) for x in (k / (size - 1.0) for k in range(size)))
+
+
+def time_case(targets, frames, repeats, memoSize=0, doc=None):
+    """Microseconds per Evaluator.evaluate(), averaged over frames.
+
+    Every frame is timed on its own and keeps its best of repeats sweeps,
+    so a hiccup of the machine only spoils the frames it lands on. The
+    frame memo is off unless memoSize is given, otherwise every sweep after
+    the first would only time memo hits.
+    """
+    evaluator = core.Evaluator(memoSize)
+    obj = c4d.BaseObject(doc=doc)
+    # Warm up the target caches so only the per-frame cost is measured
+    for settings in frames:
+        evaluator.evaluate(obj, targets, settings)
+    best = [None] * len(frames)
+    clock = time.perf_counter
+    # Same as timeit: no collector pauses while timing
+    enabled = gc.isenabled()
+    gc.disable()
+    for _ in range(repeats):
+        for k, settings in enumerate(frames):
+            start = clock()
+            evaluator.evaluate(obj, targets, settings)
+            elapsed = clock() - start
+            if best[k] is None or elapsed < best[k]:
+                best[k] = elapsed
+    if enabled:
+        gc.enable()
+    return sum(best) / len(frames) * 1.0e6
+
+
+def time_samples(targets, frames, repeats, samples):
+    """Best microseconds per sample of Evaluator.compose_samples(), samples frames at a time."""
+    evaluator = core.Evaluator(0)
+    obj = c4d.BaseObject()
+    current = obj.GetMg()
+    basis = core.relative_basis(obj)
+    groups = [frames[k:k + samples] for k in range(0, len(frames), samples)]
+    for group in groups:
+        evaluator.compose_samples(current, targets, group, basis)
+    best = [None] * len(groups)
+    clock = time.perf_counter
+    enabled = gc.isenabled()
+    gc.disable()
+    for _ in range(repeats):
+        for k, group in enumerate(groups):
+            start = clock()
+            evaluator.compose_samples(current, targets, group, basis)
+            elapsed = clock() - start
+            if best[k] is None or elapsed < best[k]:
+                best[k] = elapsed
+    if enabled:
+        gc.enable()
+    return sum(best) / len(frames) * 1.0e6
+
+
+def time_batch(targets, frames, repeats):
+    """Best microseconds per sample of one evaluate_path() call over all frames."""
+    evaluator = core.Evaluator(0)
+    params = batch.segment_params(evaluator, targets, frames)
+    batch.evaluate_path(evaluator, targets, params, frames[0])
+    best = None
+    clock = time.perf_counter
+    enabled = gc.isenabled()
+    gc.disable()
+    for _ in range(repeats):
+        start = clock()
+        batch.evaluate_path(evaluator, targets, params, frames[0])
+        elapsed = clock() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    if enabled:
+        gc.enable()
+    return best / len(frames) * 1.0e6
+
+
+def run(counts, repeats, only=None):
+    results = {}
+    for count in counts:
+        targets = make_targets(count)
+        for interpName, interpolation, softness in INTERPOLATIONS:
+            for rotName, rotation in ROTATIONS:
+                key = "%d/%s/%s" % (count, interpName, rotName)
+                if only and only not in key:
+                    continue
+                frames = make_settings(interpolation, softness, rotation)
+                results[key] = time_case(targets, frames, repeats)
+                print("%-28s %10.2f us/eval" % (key, results[key]))
+        # Scrubbing back and forth over frames that were evaluated before
+        key = "%d/scrub" % count
+        if not only or only in key:
+            frames = make_settings(core.INTERP_SOFT, 0.5, {})
+            results[key] = time_case(targets, frames, repeats, core.FrameMemo.SIZE)
+            print("%-28s %10.2f us/eval" % (key, results[key]))
+        # The same with the tag's default channels, Scale comes from the object
+        key = "%d/scrub-default" % count
+        if not only or only in key:
+            frames = make_settings(core.INTERP_SOFT, 0.5, {}, scale=False)
+            results[key] = time_case(targets, frames, repeats, core.FrameMemo.SIZE)
+            print("%-28s %10.2f us/eval" % (key, results[key]))
+        # Constant speed: an arc length lookup, targets in a document whose
+        # dirty counts tell that none of them moved
+        key = "%d/constant-speed" % count
+        if not only or only in key:
+            doc = c4d.BaseDocument()
+            frames = make_settings(core.INTERP_SOFT, 0.5, {}, constant_speed=True)
+            results[key] = time_case(make_targets(count, doc), frames, repeats, doc=doc)
+            print("%-28s %10.2f us/eval" % (key, results[key]))
+        # Motion blur: eight sub-frame samples per frame with compose_samples()
+        key = "%d/subframes" % count
+        if not only or only in key:
+            frames = make_settings(core.INTERP_SOFT, 0.5, {})
+            results[key] = time_samples(targets, frames, repeats, 8)
+            print("%-28s %10.2f us/eval" % (key, results[key]))
+        # Easing within each segment
+        key = "%d/eased" % count
+        if not only or only in key:
+            frames = make_settings(core.INTERP_SOFT, 0.5, {}, make_easing())
+            results[key] = time_case(targets, frames, repeats)
+            print("%-28s %10.2f us/eval" % (key, results[key]))
+        # Kochanek-Bartels tangents, read from the targets' TCB tags
+        key = "%d/tcb" % count
+        if not only or only in key:
+            tcbTargets = make_targets(count)
+            add_tcb_tags(tcbTargets)
+            frames = make_settings(core.INTERP_TCB, 1.0, {})
+            results[key] = time_case(tcbTargets, frames, repeats)
+            print("%-28s %10.2f us/eval" % (key, results[key]))
+        # Every slider position in one batch call
+        key = "%d/batch" % count
+        if not only or only in key:
+            frames = make_settings(core.INTERP_SOFT, 0.5, {"quaternion": True})
+            results[key] = time_batch(targets, frames, repeats)
+            print("%-28s %10.2f us/eval" % (key, results[key]))
+        # The same targets as the clones of a MoGraph generator
+        key = "%d/clones" % count
+        if not only or only in key:
+            generator = c4d.BaseObject()
+            generator.modata = mograph.MoData(t.GetMg() for t in targets)
+            clones = core.CloneSource().get(generator)
+            frames = make_settings(core.INTERP_SOFT, 0.5, {})
+            results[key] = time_case(clones, frames, repeats)
+            print("%-28s %10.2f us/eval" % (key, results[key]))
+    return results
+
+
+def load_baselines():
+    if not os.path.exists(BASELINES_PATH):
+        return None
+    with open(BASELINES_PATH) as f:
+        return json.load(f)
+
+
+def save_baselines(results):
+    # Keep the cases that were not run this time, e.g. with --only
+    data = load_baselines() or {"results": {}}
+    data["python"] = platform.python_version()
+    data["machine"] = platform.machine()
+    data["results"].update((key, round(value, 2)) for key, value in results.items())
+    with open(BASELINES_PATH, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print("Saved %d baselines to %s" % (len(results), BASELINES_PATH))
+
+
+def check_baselines(results, tolerance):
+    """Prints the cases slower than their baseline by more than tolerance. Returns their count."""
+    baselines = load_baselines()
+    if baselines is None:
+        print("No baselines.json, run with --save first")
+        return 0
+    regressions = 0
+    for key, value in results.items():
+        base = baselines["results"].get(key)
+        if base is None:
+            continue
+        change = value / base - 1.0
+        if change > tolerance:
+            regressions += 1
+            print("SLOWER %-28s %10.2f -> %10.2f us/eval (%+.0f%%)" % (key, base, value, change * 100.0))
+    print("%d regression(s) over %.0f%%" % (regressions, tolerance * 100.0))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the Simple Moves core outside Cinema 4D")
+    parser.add_argument("--save", action="store_true", help="store the results as baselines.json")
+    parser.add_argument("--check", action="store_true", help="compare with baselines.json, exit 1 on a regression")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed slowdown for --check (0.25 = 25%%)")
+    parser.add_argument("--quick", action="store_true", help="fewer target counts and repeats")
+    parser.add_argument("--repeats", type=int, default=None, help="sweeps per case, the best one counts")
+    parser.add_argument("--only", default=None, help="only run cases whose name contains this")
+    args = parser.parse_args(argv)
+
+    counts = QUICK_TARGET_COUNTS if args.quick else TARGET_COUNTS
+    repeats = args.repeats or (5 if args.quick else 15)
+    results = run(counts, repeats, args.only)
+    if args.save:
+        save_baselines(results)
+    if args.check and check_baselines(results, args.tolerance):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
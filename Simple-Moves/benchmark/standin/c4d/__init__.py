@@ -0,0 +1,202 @@
+"""
+Pure-Python stand-in for the parts of the c4d module the Simple Moves core
+uses, so it can be imported and timed outside Cinema 4D. Only meant for the
+benchmark: the maths matches closely enough to drive the same code paths,
+it is not a replacement for the real thing.
+"""
+
+
+import itertools
+import math
+
+
+ROTATIONORDER_DEFAULT = 6
+DIRTYFLAGS_MATRIX = 2
+DIRTYFLAGS_DATA = 1
+ID_BASEOBJECT_ROTATION_ORDER = 904
+HDIRTYFLAGS_OBJECT_MATRIX = 4
+HDIRTYFLAGS_OBJECT_HIERARCHY = 16
+HDIRTYFLAGS_TAG = 32
+
+MODATA_MATRIX = 10000000
+MODATA_FLAGS = 10000003
+MOGENFLAG_CLONE_ON = 1
+
+# Registered by the Simple Moves TCB tag description
+SIMPLEMOVES_TCB_TENSION = 1000
+SIMPLEMOVES_TCB_CONTINUITY = 1001
+SIMPLEMOVES_TCB_BIAS = 1002
+
+
+class Vector(object):
+
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x=0.0, y=None, z=None):
+        if isinstance(x, Vector):
+            x, y, z = x.x, x.y, x.z
+        elif y is None:
+            y = z = x
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    def __add__(self, other):
+        return Vector(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other):
+        return Vector(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __neg__(self):
+        return Vector(-self.x, -self.y, -self.z)
+
+    def __mul__(self, other):
+        if isinstance(other, Vector):
+            return self.x * other.x + self.y * other.y + self.z * other.z
+        return Vector(self.x * other, self.y * other, self.z * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        return Vector(self.x / other, self.y / other, self.z / other)
+
+    def __mod__(self, other):
+        return Vector(self.y * other.z - self.z * other.y,
+                      self.z * other.x - self.x * other.z,
+                      self.x * other.y - self.y * other.x)
+
+    def __getitem__(self, index):
+        return (self.x, self.y, self.z)[index]
+
+    def __eq__(self, other):
+        return isinstance(other, Vector) and (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    def __repr__(self):
+        return "Vector(%g, %g, %g)" % (self.x, self.y, self.z)
+
+    def GetLength(self):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def GetNormalized(self):
+        length = self.GetLength()
+        if length == 0.0:
+            return Vector(self)
+        return Vector(self.x / length, self.y / length, self.z / length)
+
+
+class Matrix(object):
+
+    __slots__ = ("off", "v1", "v2", "v3")
+
+    def __init__(self, off=None, v1=None, v2=None, v3=None):
+        self.off = Vector(off) if off is not None else Vector(0.0)
+        self.v1 = Vector(v1) if v1 is not None else Vector(1.0, 0.0, 0.0)
+        self.v2 = Vector(v2) if v2 is not None else Vector(0.0, 1.0, 0.0)
+        self.v3 = Vector(v3) if v3 is not None else Vector(0.0, 0.0, 1.0)
+
+    def __mul__(self, other):
+        if isinstance(other, Vector):
+            return self.off + self.v1 * other.x + self.v2 * other.y + self.v3 * other.z
+        rotate = lambda v: self.v1 * v.x + self.v2 * v.y + self.v3 * v.z # noqa: E731
+        return Matrix(self * other.off, rotate(other.v1), rotate(other.v2), rotate(other.v3))
+
+    def __repr__(self):
+        return "Matrix(%r, %r, %r, %r)" % (self.off, self.v1, self.v2, self.v3)
+
+
+_guids = itertools.count(1)
+
+
+class BaseDocument(object):
+    """Document-wide dirty counts, bumped by the objects in it."""
+
+    def __init__(self):
+        self._hdirty = {}
+
+    def GetHDirty(self, mask):
+        return self._hdirty.get(mask, 0)
+
+    def SetHDirty(self, mask):
+        self._hdirty[mask] = self._hdirty.get(mask, 0) + 1
+
+
+class BaseObject(object):
+    """Scene object with a global matrix, a parent and a matrix dirty count."""
+
+    def __init__(self, mg=None, parent=None, doc=None):
+        self._mg = mg if mg is not None else Matrix()
+        self._parent = parent
+        self._dirty = 1
+        self._guid = next(_guids)
+        self._tags = {}
+        self._doc = doc
+
+    def GetMg(self):
+        m = self._mg
+        return Matrix(m.off, m.v1, m.v2, m.v3)
+
+    def SetMg(self, m):
+        self._mg = Matrix(m.off, m.v1, m.v2, m.v3)
+        self._dirty += 1
+        if self._doc is not None:
+            self._doc.SetHDirty(HDIRTYFLAGS_OBJECT_MATRIX)
+
+    def GetDocument(self):
+        return self._doc
+
+    def GetUp(self):
+        return self._parent
+
+    def GetUpMg(self):
+        return self._parent.GetMg() if self._parent is not None else Matrix()
+
+    def GetRelRot(self):
+        # No parents or frozen transforms in the benchmark scenes
+        return utils.MatrixToHPB(self._mg)
+
+    def GetFrozenRot(self):
+        return Vector(0.0)
+
+    def GetDirty(self, flags):
+        return self._dirty
+
+    def GetGUID(self):
+        return self._guid
+
+    def GetTag(self, type):
+        return self._tags.get(type)
+
+    def InsertTag(self, tag):
+        self._tags[tag.GetType()] = tag
+
+    def __getitem__(self, paramId):
+        if paramId == ID_BASEOBJECT_ROTATION_ORDER:
+            return ROTATIONORDER_DEFAULT
+        raise KeyError(paramId)
+
+
+class BaseTag(object):
+    """Tag with plain parameters and a data dirty count."""
+
+    def __init__(self, type):
+        self._type = type
+        self._data = {}
+        self._dirty = 1
+
+    def GetType(self):
+        return self._type
+
+    def GetDirty(self, flags):
+        return self._dirty
+
+    def __getitem__(self, paramId):
+        return self._data[paramId]
+
+    def __setitem__(self, paramId, value):
+        self._data[paramId] = value
+        self._dirty += 1
+
+
+from . import utils # noqa: E402
+from . import modules # noqa: E402
+from .modules import mograph # noqa: E402
@@ -0,0 +1 @@
+"""Stand-in for c4d.modules, only mograph is provided."""
@@ -0,0 +1,32 @@
+"""Stand-in for the c4d.modules.mograph functions used by the Simple Moves core."""
+
+
+import c4d
+
+
+class MoData(object):
+    """Clone arrays of a generator, by MODATA_* id."""
+
+    def __init__(self, matrices, flags=None):
+        self._arrays = {c4d.MODATA_MATRIX: list(matrices)}
+        if flags is not None:
+            self._arrays[c4d.MODATA_FLAGS] = list(flags)
+        self._dirty = 1
+
+    def GetArray(self, id):
+        return self._arrays.get(id)
+
+    def GetCount(self):
+        return len(self._arrays[c4d.MODATA_MATRIX])
+
+    def GetDirty(self):
+        return self._dirty
+
+
+def GeGetMoData(op):
+    """MoData of a stand-in generator, None for plain objects."""
+    return getattr(op, "modata", None)
+
+
+def GeGetMoDataSelection(tag):
+    return None
@@ -0,0 +1,65 @@
+"""Stand-ins for the c4d.utils functions used by the Simple Moves core."""
+
+
+import math
+
+from . import Vector, Matrix, ROTATIONORDER_DEFAULT
+
+
+def MixVec(v1, v2, t):
+    return v1 + (v2 - v1) * t
+
+
+def RangeMap(value, mininput, maxinput, minoutput, maxoutput, clampval=False, curve=None):
+    if maxinput == mininput:
+        result = minoutput
+    else:
+        result = minoutput + (value - mininput) / (maxinput - mininput) * (maxoutput - minoutput)
+    if clampval:
+        lo = min(minoutput, maxoutput)
+        hi = max(minoutput, maxoutput)
+        result = min(max(result, lo), hi)
+    return result
+
+
+def _rot_x(a):
+    c, s = math.cos(a), math.sin(a)
+    return Matrix(None, Vector(1.0, 0.0, 0.0), Vector(0.0, c, s), Vector(0.0, -s, c))
+
+
+def _rot_y(a):
+    c, s = math.cos(a), math.sin(a)
+    return Matrix(None, Vector(c, 0.0, -s), Vector(0.0, 1.0, 0.0), Vector(s, 0.0, c))
+
+
+def _rot_z(a):
+    c, s = math.cos(a), math.sin(a)
+    return Matrix(None, Vector(c, s, 0.0), Vector(-s, c, 0.0), Vector(0.0, 0.0, 1.0))
+
+
+def HPBToMatrix(w, rot_order=ROTATIONORDER_DEFAULT):
+    # Heading around Y, then pitch around X, then bank around Z
+    return _rot_y(w.x) * _rot_x(w.y) * _rot_z(w.z)
+
+
+def MatrixToHPB(m, rot_order=ROTATIONORDER_DEFAULT):
+    v1 = m.v1.GetNormalized()
+    v2 = m.v2.GetNormalized()
+    v3 = m.v3.GetNormalized()
+    p = math.asin(max(-1.0, min(1.0, -v3.y)))
+    if abs(math.cos(p)) > 1.0e-9:
+        h = math.atan2(v3.x, v3.z)
+        b = math.atan2(v1.y, v2.y)
+    else:
+        h = 0.0
+        b = math.atan2(-v2.x, v1.x)
+    return Vector(h, p, b)
+
+
+def GetOptimalAngle(hpb_old, hpb_new, order=ROTATIONORDER_DEFAULT):
+    # Per component wrap to the nearest turn, close enough for timing
+    def nearest(old, new):
+        return old + (new - old + math.pi) % (2.0 * math.pi) - math.pi
+    return Vector(nearest(hpb_old.x, hpb_new.x),
+                  nearest(hpb_old.y, hpb_new.y),
+                  nearest(hpb_old.z, hpb_new.z))
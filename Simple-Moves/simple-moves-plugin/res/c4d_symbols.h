@@ -0,0 +1,5 @@
+enum
+{
+	// End of symbol definition
+	_DUMMY_ELEMENT_
+};
@@ -0,0 +1,42 @@
+#ifndef TSIMPLEMOVES_H__
+#define TSIMPLEMOVES_H__
+
+enum
+{
+	SIMPLEMOVES_MODE                 = 1000,
+		SIMPLEMOVES_MODE_SIMPLE        = 0,
+		SIMPLEMOVES_MODE_TOTAL         = 1,
+	SIMPLEMOVES_SIMPLE               = 1001,
+	SIMPLEMOVES_TOTAL                = 1002,
+	SIMPLEMOVES_TARGETS              = 1003,
+	SIMPLEMOVES_CONSTANT_SPEED       = 1004,
+	SIMPLEMOVES_DRIVEN               = 1005,
+	SIMPLEMOVES_STAGGER              = 1006,
+	SIMPLEMOVES_CLONES               = 1007,
+	SIMPLEMOVES_CLONES_SELECTION     = 1008,
+
+	SIMPLEMOVES_GROUP_MATRIX         = 1100,
+	SIMPLEMOVES_POSITION             = 1101,
+	SIMPLEMOVES_SCALE                = 1102,
+	SIMPLEMOVES_ROTATION             = 1103,
+	SIMPLEMOVES_SHORTEST             = 1104,
+	SIMPLEMOVES_QUATERNION           = 1105,
+
+	SIMPLEMOVES_INTERPOLATION        = 1200,
+		SIMPLEMOVES_INTERPOLATION_LINEAR = 0,
+		SIMPLEMOVES_INTERPOLATION_SOFT   = 1,
+		SIMPLEMOVES_INTERPOLATION_TCB    = 2,
+	SIMPLEMOVES_SOFTNESS             = 1201,
+	SIMPLEMOVES_EASE                 = 1202,
+	SIMPLEMOVES_EASING               = 1203,
+
+	SIMPLEMOVES_SHOW_PATH            = 1300,
+
+	SIMPLEMOVES_CHANNELS             = 1400,
+
+	SIMPLEMOVES_GROUP_ERRORS         = 1500,
+	SIMPLEMOVES_ERROR_COUNT          = 1501,
+	SIMPLEMOVES_LAST_ERROR           = 1502
+};
+
+#endif // TSIMPLEMOVES_H__
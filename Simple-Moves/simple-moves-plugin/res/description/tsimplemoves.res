@@ -0,0 +1,91 @@
+CONTAINER Tsimplemoves
+{
+	NAME Tsimplemoves;
+	INCLUDE Tbase;
+	INCLUDE Texpression;
+
+	GROUP ID_TAGPROPERTIES
+	{
+		LONG SIMPLEMOVES_MODE
+		{
+			ANIM OFF;
+			CYCLE
+			{
+				SIMPLEMOVES_MODE_SIMPLE;
+				SIMPLEMOVES_MODE_TOTAL;
+			}
+		}
+		REAL SIMPLEMOVES_SIMPLE { UNIT PERCENT; MIN 0.0; MINSLIDER 0.0; MAXSLIDER 1000.0; STEP 1.0; CUSTOMGUI REALSLIDER; }
+		REAL SIMPLEMOVES_TOTAL { UNIT PERCENT; MIN 0.0; MAX 100.0; MINSLIDER 0.0; MAXSLIDER 100.0; STEP 1.0; CUSTOMGUI REALSLIDER; }
+		BOOL SIMPLEMOVES_CONSTANT_SPEED { ANIM OFF; }
+		IN_EXCLUDE SIMPLEMOVES_TARGETS
+		{
+			NUM_FLAGS 0;
+			INIT_STATE 0;
+			SEND_SELCHNGMSG 1;
+			ACCEPT { Obase; }
+		}
+		LINK SIMPLEMOVES_CLONES { ACCEPT { Obase; } }
+		LINK SIMPLEMOVES_CLONES_SELECTION { ACCEPT { 1021338; } }
+		IN_EXCLUDE SIMPLEMOVES_DRIVEN
+		{
+			NUM_FLAGS 0;
+			INIT_STATE 0;
+			SEND_SELCHNGMSG 1;
+			ACCEPT { Obase; }
+		}
+		REAL SIMPLEMOVES_STAGGER { UNIT PERCENT; MIN 0.0; MINSLIDER 0.0; MAXSLIDER 100.0; STEP 1.0; CUSTOMGUI REALSLIDER; }
+
+		GROUP SIMPLEMOVES_GROUP_MATRIX
+		{
+			DEFAULT 1;
+			COLUMNS 3;
+
+			BOOL SIMPLEMOVES_POSITION { }
+			BOOL SIMPLEMOVES_SCALE { }
+			BOOL SIMPLEMOVES_ROTATION { }
+			BOOL SIMPLEMOVES_SHORTEST { }
+			BOOL SIMPLEMOVES_QUATERNION { }
+		}
+
+		LONG SIMPLEMOVES_INTERPOLATION
+		{
+			ANIM OFF;
+			CYCLE
+			{
+				SIMPLEMOVES_INTERPOLATION_LINEAR;
+				SIMPLEMOVES_INTERPOLATION_SOFT;
+				SIMPLEMOVES_INTERPOLATION_TCB;
+			}
+		}
+		REAL SIMPLEMOVES_SOFTNESS { UNIT PERCENT; MIN 0.0; MAX 100.0; MINSLIDER 0.0; MAXSLIDER 100.0; STEP 1.0; CUSTOMGUI REALSLIDER; }
+		BOOL SIMPLEMOVES_EASE { ANIM OFF; }
+		SPLINE SIMPLEMOVES_EASING
+		{
+			SHOWGRID_H;
+			SHOWGRID_V;
+			MINSIZE_H 120;
+			MINSIZE_V 90;
+			EDIT_H;
+			EDIT_V;
+			X_MIN 0;
+			X_MAX 1;
+			Y_MIN 0;
+			Y_MAX 1;
+			X_STEPS 1;
+			Y_STEPS 1;
+		}
+
+		BOOL SIMPLEMOVES_SHOW_PATH { ANIM OFF; }
+
+		STRING SIMPLEMOVES_CHANNELS { ANIM OFF; CUSTOMGUI MULTISTRING; }
+
+		GROUP SIMPLEMOVES_GROUP_ERRORS
+		{
+			DEFAULT 1;
+
+			LONG SIMPLEMOVES_ERROR_COUNT { ANIM OFF; MIN 0; }
+			STRING SIMPLEMOVES_LAST_ERROR { ANIM OFF; }
+		}
+	}
+}
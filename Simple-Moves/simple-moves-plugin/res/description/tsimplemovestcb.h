@@ -0,0 +1,11 @@
+#ifndef TSIMPLEMOVESTCB_H__
+#define TSIMPLEMOVESTCB_H__
+
+enum
+{
+	SIMPLEMOVES_TCB_TENSION          = 1000,
+	SIMPLEMOVES_TCB_CONTINUITY       = 1001,
+	SIMPLEMOVES_TCB_BIAS             = 1002
+};
+
+#endif // TSIMPLEMOVESTCB_H__
@@ -0,0 +1,12 @@
+CONTAINER Tsimplemovestcb
+{
+	NAME Tsimplemovestcb;
+	INCLUDE Tbase;
+
+	GROUP ID_TAGPROPERTIES
+	{
+		REAL SIMPLEMOVES_TCB_TENSION { MIN -1.0; MAX 1.0; MINSLIDER -1.0; MAXSLIDER 1.0; STEP 0.01; CUSTOMGUI REALSLIDER; }
+		REAL SIMPLEMOVES_TCB_CONTINUITY { MIN -1.0; MAX 1.0; MINSLIDER -1.0; MAXSLIDER 1.0; STEP 0.01; CUSTOMGUI REALSLIDER; }
+		REAL SIMPLEMOVES_TCB_BIAS { MIN -1.0; MAX 1.0; MINSLIDER -1.0; MAXSLIDER 1.0; STEP 0.01; CUSTOMGUI REALSLIDER; }
+	}
+}
@@ -0,0 +1,303 @@
+"""
+Samplistic Simple Moves - Bake
+Author: Delek Miller | Samplistic
+Description: Bake Simple Moves tags to Position/Scale/Rotation keyframes,
+and their Channels to keyframes of those parameters, over the document
+frame range.
+
+Tags whose targets and driven object are static are baked without touching
+the document time: the slider tracks are sampled with CTrack.GetValue and
+the matrices for every frame are composed in one go with
+Evaluator.compose_samples, without writing to the driven object. Tags that
+depend on something animated (targets with tracks or expression tags, an
+animated parent) need the scene to run, so all of those share a single pass
+over the frame range.
+
+sample_subframes() takes the same static path for the sub-frame sample
+times of motion blur.
+
+Written for Maxon Cinema 4D 2025.7.3
+Python version 3.11.4
+"""
+
+
+import c4d # type: ignore
+from c4d import utils as u # type: ignore
+
+import simple_moves_core as core
+import simple_moves_tags as tags
+import simple_moves_channels as channels
+
+
+def is_animated(obj, ignore=None):
+    """True if obj or one of its parents has tracks or a running expression tag."""
+    if isinstance(obj, core.CloneTarget):
+        # Effectors and fields can move clones without any tracks
+        return True
+    while obj is not None:
+        if obj.GetCTracks():
+            return True
+        for tag in obj.GetTags():
+            if tag is ignore or not (tag.GetInfo() & c4d.TAG_EXPRESSION):
+                continue
+            if tag[c4d.EXPRESSION_ENABLE] != False:
+                return True
+        obj = obj.GetUp()
+    return False
+
+
+def iter_values(doc, tag, times):
+    """Settings field values for each time in turn, read from the tag's tracks."""
+    base = tags.read_values(tag)
+    tracks = tags.get_tracks(tag)
+    fps = doc.GetFps()
+    for time in times:
+        values = dict(base)
+        for name, track in tracks.items():
+            values[name] = track.GetValue(doc, time, fps)
+        yield values
+
+
+def sample_values(doc, tag, times):
+    """Settings field values for every time, read from the tag's tracks."""
+    return list(iter_values(doc, tag, times))
+
+
+def evaluate_static(evaluator, obj, index, targets, settings):
+    """Global matrix of obj for every frame, without running the document."""
+    start = obj.GetMg()
+    basis = core.relative_basis(obj)
+    return evaluator.compose_samples(start, targets, settings, basis, index)
+
+
+def get_subframe_times(doc, frame, count, shutter=1.0):
+    """count sample times spread evenly over shutter frames, centred on frame."""
+    fps = doc.GetFps()
+    if count <= 1:
+        return [c4d.BaseTime(frame, fps)]
+    start = frame - shutter * 0.5
+    step = shutter / (count - 1)
+    return [c4d.BaseTime(float(start + k * step) / fps) for k in range(count)]
+
+
+def sample_subframes(doc, tag, times, evaluator=None):
+    """Global matrices of the tag's driven objects at sub-frame times, e.g. for motion blur.
+
+    Returns one list of matrices per driven object, in get_driven_objects()
+    order. The slider values come from the tag's tracks and the targets are
+    taken where they are now, so nothing but the tag is evaluated: the
+    targets, segment coefficients and rotation data are looked up once and
+    every sample only evaluates its segment. Pass the tag's evaluator to
+    reuse its caches.
+    """
+    targets = tags.get_targets(tag, doc)
+    if not targets:
+        return []
+    if evaluator is None:
+        evaluator = core.Evaluator()
+    easing = tags.read_easing(tag)
+    settings = [core.Settings(easing=easing, **values) for values in sample_values(doc, tag, times)]
+    return [evaluate_static(evaluator, obj, index, targets, settings)
+            for index, obj in enumerate(tags.get_driven_objects(tag, doc, targets))]
+
+
+def sample_channels(evaluator, obj, index, targets, settings, channelList, text):
+    """(DescID, kind, values) of every channel of obj, one blended value per settings.
+
+    Frames where a target lacks the parameter keep obj's current value,
+    like the tag does.
+    """
+    sampled = None
+    for k, frameSettings in enumerate(settings):
+        blended = channels.blend_channels(evaluator, obj, targets, frameSettings, channelList, text, index)
+        if sampled is None:
+            sampled = [(descId, kind, []) for descId, kind, _ in blended]
+        for (descId, _, values), (_, _, value) in zip(sampled, blended):
+            values.append(value if value is not None else channels.read_value(obj, descId))
+    return sampled or []
+
+
+def evaluate_stepped(doc, objects, times, channelIds=None):
+    """Global and parent matrices of objects for every time, running the document once.
+
+    channelIds holds a list of channel DescIDs per object whose values are
+    read every time as well, they come last in each object's result.
+    """
+    current = doc.GetTime()
+    if channelIds is None:
+        channelIds = [[] for _ in objects]
+    results = [([], []) + tuple([] for _ in ids) for ids in channelIds]
+    for time in times:
+        doc.SetTime(time)
+        doc.ExecutePasses(None, True, True, True, c4d.BUILDFLAGS_NONE)
+        for obj, ids, result in zip(objects, channelIds, results):
+            result[0].append(obj.GetMg())
+            result[1].append(obj.GetUpMg())
+            for descId, values in zip(ids, result[2:]):
+                values.append(channels.read_value(obj, descId))
+    doc.SetTime(current)
+    doc.ExecutePasses(None, True, True, True, c4d.BUILDFLAGS_NONE)
+    return results
+
+
+def write_track(node, descId, times, values):
+    """Replaces the track of a parameter of node with linear keys, one per time."""
+    track = node.FindCTrack(descId)
+    if track is None:
+        track = c4d.CTrack(node, descId)
+        node.InsertTrackSorted(track)
+    curve = track.GetCurve()
+    curve.FlushKeys()
+    curve.ResizeKeyCount(len(times))
+    for k in range(len(times)):
+        key = curve.GetKey(k)
+        key.SetTime(curve, times[k])
+        key.SetValue(curve, values[k])
+        key.SetInterpolation(curve, c4d.CINTERPOLATION_LINEAR)
+
+
+def write_vector_track(obj, paramId, times, vectors):
+    """Replaces the X/Y/Z tracks of a vector parameter with linear keys, one per time."""
+    for axis, values in ((c4d.VECTOR_X, [v.x for v in vectors]),
+                         (c4d.VECTOR_Y, [v.y for v in vectors]),
+                         (c4d.VECTOR_Z, [v.z for v in vectors])):
+        descId = c4d.DescID(c4d.DescLevel(paramId, c4d.DTYPE_VECTOR, 0),
+                            c4d.DescLevel(axis, c4d.DTYPE_REAL, 0))
+        write_track(obj, descId, times, values)
+
+
+def write_keys(doc, obj, times, matrices, parents, channels):
+    """Writes the driven PSR channels of obj from global matrices."""
+    order = obj[c4d.ID_BASEOBJECT_ROTATION_ORDER]
+    positions, scales, rotations = [], [], []
+    prev = None
+    lastParent = parentInv = None
+    for mg, parentMg in zip(matrices, parents):
+        if parentMg is not lastParent:
+            # Static parents are the same matrix every frame, invert it once
+            lastParent = parentMg
+            parentInv = ~parentMg
+        ml = parentInv * mg
+        positions.append(ml.off)
+        scales.append(core.get_scale(ml))
+        rot = u.MatrixToHPB(ml, order)
+        if prev is not None:
+            # Keep the curves continuous instead of wrapping at +-180
+            rot = u.GetOptimalAngle(prev, rot, order)
+        rotations.append(rot)
+        prev = rot
+
+    doc.AddUndo(c4d.UNDOTYPE_CHANGE, obj)
+    if "position" in channels:
+        write_vector_track(obj, c4d.ID_BASEOBJECT_REL_POSITION, times, positions)
+    if "scale" in channels:
+        write_vector_track(obj, c4d.ID_BASEOBJECT_REL_SCALE, times, scales)
+    if "rotation" in channels:
+        write_vector_track(obj, c4d.ID_BASEOBJECT_REL_ROTATION, times, rotations)
+
+
+def can_key_channels(obj, sampled):
+    """True if write_channel_keys() can key every sampled channel of obj."""
+    return all(channels.track_ids(obj, descId, kind) is not None and all(v is not None for v in values)
+               for descId, kind, values in sampled)
+
+
+def write_channel_keys(doc, obj, times, sampled):
+    """Keys every sampled channel of obj. Returns False if one of them couldn't be keyed."""
+    complete = True
+    for descId, kind, values in sampled:
+        ids = channels.track_ids(obj, descId, kind)
+        if ids is None or any(v is None for v in values):
+            complete = False
+            continue
+        doc.AddUndo(c4d.UNDOTYPE_CHANGE, obj)
+        if kind is c4d.Vector:
+            for trackId, axis in zip(ids, "xyz"):
+                write_track(obj, trackId, times, [getattr(v, axis) for v in values])
+        else:
+            write_track(obj, ids[0], times, [float(v) for v in values])
+    return complete
+
+
+def get_frame_times(doc):
+    fps = doc.GetFps()
+    start = doc.GetMinTime().GetFrame(fps)
+    end = doc.GetMaxTime().GetFrame(fps)
+    return [c4d.BaseTime(f, fps) for f in range(start, end + 1)]
+
+
+def bake_tags(doc, bakeTags, remove=False, unbaked=None):
+    """Bakes Simple Moves tags to keyframes. Returns the number of tags baked.
+
+    The Channels are keyed too. Tags with a channel that can't be keyed,
+    e.g. one the driven object's description doesn't know, are left as they
+    are, without keys, and appended to unbaked if given.
+    """
+    times = get_frame_times(doc)
+    defaults = core.Settings()
+    jobs = []
+    stepped = []
+    for tag in bakeTags:
+        targets = tags.get_targets(tag, doc)
+        if not targets:
+            continue
+        frames = sample_values(doc, tag, times)
+        psr = set(name for name in ("position", "scale", "rotation")
+                  if any(values.get(name, getattr(defaults, name)) for values in frames))
+        channelText = tags.read_channels(tag)
+        if not psr and not channelText:
+            continue
+        easing = tags.read_easing(tag)
+        settings = [core.Settings(easing=easing, **values) for values in frames]
+        targetsAnimated = any(is_animated(t) for t in targets)
+        # Driven objects of one tag share its evaluator, target and channel caches
+        evaluator = core.Evaluator()
+        channelList = channels.ChannelList()
+        for index, obj in enumerate(tags.get_driven_objects(tag, doc, targets)):
+            job = [tag, obj, psr, None, None, []]
+            if targetsAnimated or is_animated(obj, ignore=tag):
+                # The tag writes the channels itself while the document runs
+                kinds = channelList.resolve(channelText, obj) if channelText else []
+                if isinstance(targets, core.CloneList):
+                    kinds = []
+                job[5] = [(descId, kind, None) for descId, kind in kinds]
+                stepped.append(job)
+            else:
+                if psr:
+                    job[3] = evaluate_static(evaluator, obj, index, targets, settings)
+                    job[4] = [obj.GetUpMg()] * len(times)
+                job[5] = sample_channels(evaluator, obj, index, targets, settings, channelList, channelText)
+            jobs.append(job)
+
+    if stepped:
+        results = evaluate_stepped(doc, [job[1] for job in stepped], times,
+                                   [[descId for descId, _, _ in job[5]] for job in stepped])
+        for job, result in zip(stepped, results):
+            job[3] = result[0]
+            job[4] = result[1]
+            job[5] = [(descId, kind, values) for (descId, kind, _), values in zip(job[5], result[2:])]
+
+    incomplete = []
+    for tag, obj, _, _, _, sampled in jobs:
+        if tag not in incomplete and not can_key_channels(obj, sampled):
+            incomplete.append(tag)
+    if unbaked is not None:
+        unbaked.extend(incomplete)
+
+    baked = []
+    for tag, obj, psr, matrices, parents, sampled in jobs:
+        if tag in incomplete:
+            continue
+        if psr:
+            write_keys(doc, obj, times, matrices, parents, psr)
+        write_channel_keys(doc, obj, times, sampled)
+        if tag not in baked:
+            baked.append(tag)
+    for tag in baked:
+        if remove:
+            doc.AddUndo(c4d.UNDOTYPE_DELETEOBJ, tag)
+            tag.Remove()
+        else:
+            doc.AddUndo(c4d.UNDOTYPE_CHANGE_SMALL, tag)
+            tag[c4d.EXPRESSION_ENABLE] = False
+    return len(baked)
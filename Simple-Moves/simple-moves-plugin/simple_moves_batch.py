@@ -0,0 +1,208 @@
+"""
+Samplistic Simple Moves - Batch
+Author: Delek Miller | Samplistic
+Description: Evaluates a Simple Moves path at many path parameters at once,
+for baking, previews, exporters and stagger drivers that would otherwise
+loop over compose(). A path parameter is target index + mix, 0 at the
+first target and len(targets) - 1 at the last, e.g. what
+Evaluator.segment() returns as a + mix.
+
+The maths is the tag's: the segment coefficients, squad controls and TCB
+tangents come from the same SplineTable the Evaluator keeps, and only the
+per-sample part (lerps, one cubic, the rotation blend) runs here. With
+NumPy installed that part is done for all samples in one go, without it
+the samples are looped in Python with the core functions compose() uses.
+
+evaluate_path() returns (positions, scales, rotations), one row per
+parameter: NumPy arrays of shape (n, 3), (n, 3) and (n, 3) or (n, 4), or
+lists of tuples without NumPy. Rotations are what the rotation mode mixes:
+unit quaternions (w, x, y, z) in quaternion mode, global HPB in shortest
+mode and the targets' relative HPB otherwise.
+
+Written for Maxon Cinema 4D 2025.7.3
+Python version 3.11.4
+"""
+
+
+import math
+
+import c4d # type: ignore
+from c4d import utils as u # type: ignore
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import simple_moves_core as core
+
+
+def has_numpy():
+    return np is not None
+
+
+def segment_params(evaluator, targets, samples, index=0):
+    """Path parameter of each Settings in samples, with easing, Constant Speed and stagger."""
+    params = []
+    for settings in samples:
+        a, b, mix = evaluator.segment(targets, settings, index)
+        params.append(a + mix if a != b else float(a))
+    return params
+
+
+def split_params(params, cnt):
+    """Segment index and mix of each path parameter, clamped to the path."""
+    last = cnt - 1
+    lastSegment = max(cnt - 2, 0)
+    segments, mixes = [], []
+    for x in params:
+        x = min(max(float(x), 0.0), float(last))
+        s = min(int(math.floor(x)), lastSegment)
+        segments.append(s)
+        mixes.append(x - s if cnt > 1 else 0.0)
+    return segments, mixes
+
+
+def evaluate_path(evaluator, targets, params, settings, use_numpy=True):
+    """Positions, scales and rotations of the path at every parameter in params.
+
+    settings supplies the interpolation, softness and rotation mode, its
+    slider values are not used. use_numpy=False takes the pure Python path
+    even if NumPy is there.
+    """
+    cnt = len(targets)
+    if cnt == 0:
+        return None
+    spline = evaluator.full_spline_table(targets, settings.interpolation)
+    segments, mixes = split_params(params, cnt)
+    if use_numpy and np is not None:
+        return _evaluate_numpy(spline, segments, mixes, settings)
+    return _evaluate_python(spline, segments, mixes, settings)
+
+
+def _shortest_pair(entries, s):
+    # Same optimal angle as global_rotation_axes()
+    r1 = entries[s].hpb
+    return r1, u.GetOptimalAngle(r1, entries[s+1].hpb, c4d.ROTATIONORDER_DEFAULT)
+
+
+def _evaluate_python(spline, segments, mixes, settings):
+    entries = spline.entries
+    single = len(entries) == 1
+    softness = settings.path_softness()
+    pairs = {}
+    positions, scales, rotations = [], [], []
+    for s, t in zip(segments, mixes):
+        ta = entries[s]
+        tb = entries[s] if single else entries[s+1]
+
+        off = u.MixVec(ta.off, tb.off, t)
+        if softness > 0.0 and not single:
+            off = u.MixVec(off, spline.evaluate(s, t), softness)
+        positions.append((off.x, off.y, off.z))
+        scale = u.MixVec(ta.scale, tb.scale, t)
+        scales.append((scale.x, scale.y, scale.z))
+
+        if settings.quaternion:
+            q = core.quat_slerp(ta.quat, tb.quat, t)
+            if softness > 0.0 and not single:
+                q = core.quat_slerp(q, spline.squad(s, t), softness)
+            rotations.append(q)
+            continue
+        if settings.shortest:
+            if single:
+                r1 = r2 = ta.hpb
+            else:
+                pair = pairs.get(s)
+                if pair is None:
+                    pair = pairs[s] = _shortest_pair(entries, s)
+                r1, r2 = pair
+        else:
+            r1, r2 = ta.relrot, tb.relrot
+        rot = u.MixVec(r1, r2, t)
+        rotations.append((rot.x, rot.y, rot.z))
+    return positions, scales, rotations
+
+
+def _rows(vectors):
+    return np.array([(v.x, v.y, v.z) for v in vectors], dtype=float)
+
+
+def _quat_normalize(q):
+    n = np.sqrt(np.einsum("ij,ij->i", q, q))
+    out = q / np.where(n < 1.0e-12, 1.0, n)[:, None]
+    out[n < 1.0e-12] = core.QUAT_IDENTITY
+    return out
+
+
+def _quat_slerp(a, b, t, shortest=True):
+    """core.quat_slerp() for rows of quaternions, t a column of factors."""
+    dot = np.einsum("ij,ij->i", a, b)
+    if shortest:
+        flip = dot < 0.0
+        b = np.where(flip[:, None], -b, b)
+        dot = np.where(flip, -dot, dot)
+    near = np.abs(dot) > 0.9995
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    s = np.where(near, 1.0, np.sin(theta))
+    fa = np.sin((1.0 - t) * theta) / s
+    fb = np.sin(t * theta) / s
+    out = a * fa[:, None] + b * fb[:, None]
+    if near.any():
+        # Nearly parallel, lerp is accurate and avoids dividing by ~0
+        lerped = _quat_normalize(a + (b - a) * t[:, None])
+        out = np.where(near[:, None], lerped, out)
+    return out
+
+
+def _evaluate_numpy(spline, segments, mixes, settings):
+    entries = spline.entries
+    single = len(entries) == 1
+    softness = settings.path_softness()
+    s = np.asarray(segments, dtype=int)
+    t = np.asarray(mixes, dtype=float)
+    a = s
+    b = s if single else s + 1
+    tc = t[:, None]
+
+    offs = _rows(e.off for e in entries)
+    positions = offs[a] * (1.0 - tc) + offs[b] * tc
+    if softness > 0.0 and not single:
+        used = np.unique(s)
+        coefficients = np.zeros((len(spline.segments), 4, 3))
+        for k in used:
+            coefficients[k] = _rows(spline.coefficients(int(k)))
+        c = coefficients[s]
+        curve = ((c[:, 0] * tc + c[:, 1]) * tc + c[:, 2]) * tc + c[:, 3]
+        positions = positions + (curve - positions) * softness
+
+    scaleRows = _rows(e.scale for e in entries)
+    scales = scaleRows[a] * (1.0 - tc) + scaleRows[b] * tc
+
+    if settings.quaternion:
+        quats = np.array([e.quat for e in entries], dtype=float)
+        rotations = _quat_slerp(quats[a], quats[b], t)
+        if softness > 0.0 and not single:
+            controls = np.zeros((len(spline.segments), 4, 4))
+            for k in np.unique(s):
+                controls[k] = spline.squad_controls(int(k))
+            c = controls[s]
+            # quat_squad(), the controls are already in one hemisphere
+            squad = _quat_slerp(_quat_slerp(c[:, 0], c[:, 1], t, False), _quat_slerp(c[:, 2], c[:, 3], t, False),
+                                2.0 * t * (1.0 - t), False)
+            rotations = _quat_slerp(rotations, squad, np.full(len(t), softness))
+    elif settings.shortest:
+        if single:
+            rotations = np.repeat(_rows([entries[0].hpb]), len(t), axis=0)
+        else:
+            starts = np.zeros((len(spline.segments), 3))
+            ends = np.zeros((len(spline.segments), 3))
+            for k in np.unique(s):
+                r1, r2 = _shortest_pair(entries, int(k))
+                starts[k] = (r1.x, r1.y, r1.z)
+                ends[k] = (r2.x, r2.y, r2.z)
+            rotations = starts[s] * (1.0 - tc) + ends[s] * tc
+    else:
+        rots = _rows(e.relrot for e in entries)
+        rotations = rots[a] * (1.0 - tc) + rots[b] * tc
+    return positions, scales, rotations
@@ -0,0 +1,204 @@
+"""
+Samplistic Simple Moves - Channels
+Author: Delek Miller | Samplistic
+Description: Parameters besides PSR that travel with the move, e.g. a
+camera's focal length or focus distance, a light's intensity or color, or
+user data. The Channels field lists them by their c4d name or ID, one per
+line or comma separated:
+
+    CAMERA_FOCUS
+    LIGHT_COLOR, LIGHT_BRIGHTNESS
+    ID_USERDATA.2
+
+Every channel is blended between the matching parameters of the targets
+with the same segment, mix and soft-spline weights as the position.
+
+Written for Maxon Cinema 4D 2025.7.3
+Python version 3.11.4
+"""
+
+
+import re
+
+import c4d # type: ignore
+
+import simple_moves_core as core
+
+
+# Largest difference that still counts as the same value
+VALUE_EPSILON = 1.0e-9
+
+
+def parse_channel(text):
+    """DescID for "CAMERA_FOCUS", "c4d.LIGHT_COLOR", "ID_USERDATA.2" or "1000", None if unknown."""
+    parts = [part.strip() for part in text.strip().split(".")]
+    if parts and parts[0] == "c4d":
+        parts = parts[1:]
+    levels = []
+    for part in parts:
+        if part.lstrip("-").isdigit():
+            levels.append(int(part))
+            continue
+        value = getattr(c4d, part, None)
+        if not isinstance(value, int) or isinstance(value, bool):
+            return None
+        levels.append(value)
+    if not levels:
+        return None
+    if levels[0] == c4d.ID_USERDATA and len(levels) == 2:
+        return c4d.DescID(c4d.DescLevel(c4d.ID_USERDATA, c4d.DTYPE_SUBCONTAINER, 0),
+                          c4d.DescLevel(levels[1]))
+    return c4d.DescID(*[c4d.DescLevel(level) for level in levels])
+
+
+def parse_channels(text):
+    descIds = []
+    for name in re.split(r"[,;\n]+", text or ""):
+        if name.strip():
+            descId = parse_channel(name)
+            if descId is not None:
+                descIds.append(descId)
+    return descIds
+
+
+def read_value(node, descId):
+    try:
+        return node[descId]
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
+def value_kind(value):
+    """Type a channel is blended as, None for values that can't be blended."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float, c4d.Vector)):
+        return type(value)
+    return None
+
+
+def same_value(a, b):
+    if isinstance(a, c4d.Vector):
+        return (abs(a.x - b.x) <= VALUE_EPSILON and abs(a.y - b.y) <= VALUE_EPSILON
+                and abs(a.z - b.z) <= VALUE_EPSILON)
+    return abs(a - b) <= VALUE_EPSILON
+
+
+class ChannelList(object):
+    """Channels of one tag: parsed DescIDs, type checks and target values, all cached.
+
+    The text is parsed once per edit. Which channels a driven object has,
+    and as what type, is checked per object and again when its description
+    changes, since user data differs between objects of the same type.
+    Target values are read together, one row per target, and kept until the
+    target's data dirty count changes.
+    """
+
+    def __init__(self):
+        self.text = None
+        self.descIds = []
+        self._kinds = {}
+        self._values = {}
+
+    def resolve(self, text, obj):
+        """(DescID, kind) of every channel obj can be driven on."""
+        if text != self.text:
+            self.text = text
+            self.descIds = parse_channels(text)
+            self._kinds = {}
+            self._values = {}
+        key = obj.GetGUID()
+        dirty = obj.GetDirty(c4d.DIRTYFLAGS_DESCRIPTION)
+        cached = self._kinds.get(key)
+        if cached is not None and cached[0] == dirty:
+            return cached[1]
+        channels = []
+        for descId in self.descIds:
+            kind = value_kind(read_value(obj, descId))
+            if kind is not None:
+                channels.append((descId, kind))
+        self._kinds[key] = (dirty, channels)
+        return channels
+
+    def prune(self, driven, targets):
+        """Drops the cached kinds and values of objects no longer driven or targets."""
+        if len(self._kinds) <= len(driven) and len(self._values) <= len(targets):
+            return
+        keep = set(obj.GetGUID() for obj in driven)
+        self._kinds = dict((k, v) for k, v in self._kinds.items() if k in keep)
+        keep = set(obj.GetGUID() for obj in targets)
+        self._values = dict((k, v) for k, v in self._values.items() if k in keep)
+
+    def values(self, target, channels):
+        """Channel values of target, None where it has no matching parameter."""
+        key = target.GetGUID()
+        dirty = target.GetDirty(c4d.DIRTYFLAGS_DATA)
+        cached = self._values.get(key)
+        # Driven objects with the same parameters have equal, not identical, lists
+        if cached is not None and cached[0] == dirty and (cached[1] is channels or cached[1] == channels):
+            return cached[2]
+        row = []
+        for descId, kind in channels:
+            value = read_value(target, descId)
+            row.append(value if value_kind(value) is kind else None)
+        self._values[key] = (dirty, channels, row)
+        return row
+
+
+def blend_channels(evaluator, obj, targets, settings, channelList, text, index=0):
+    """(DescID, kind, value) of every channel of obj, value blended between the targets.
+
+    Uses evaluator's segment lookup and spline, so it only adds the
+    weighted sums on top of the PSR evaluation. value is None where a
+    target lacks the parameter. Clone targets have no parameters, so
+    there are no channels for them.
+    """
+    if not text or obj is None or not len(targets) or isinstance(targets, core.CloneList):
+        return []
+    channels = channelList.resolve(text, obj)
+    if not channels:
+        return []
+    a, b, mix = evaluator.segment(targets, settings, index)
+    rows = [(weight, channelList.values(targets[k], channels))
+            for k, weight in evaluator.segment_weights(targets, settings, a, b, mix)]
+
+    blended = []
+    for c, (descId, kind) in enumerate(channels):
+        if any(row[c] is None for _, row in rows):
+            blended.append((descId, kind, None))
+            continue
+        value = rows[0][1][c] * rows[0][0]
+        for weight, row in rows[1:]:
+            value = value + row[c] * weight
+        if kind is int:
+            value = int(round(value))
+        blended.append((descId, kind, value))
+    return blended
+
+
+def apply_channels(evaluator, obj, targets, settings, channelList, text, index=0):
+    """Blends the channels of obj between the targets. Returns True if anything was written."""
+    written = False
+    for descId, kind, value in blend_channels(evaluator, obj, targets, settings, channelList, text, index):
+        if value is None:
+            continue # A target without this parameter, leave it alone
+        current = read_value(obj, descId)
+        if current is None or same_value(current, value):
+            continue # Gone from obj since resolve(), or unchanged
+        obj[descId] = value
+        written = True
+    return written
+
+
+def track_ids(obj, descId, kind):
+    """Complete DescIDs of the tracks that animate a channel of obj, one per vector
+    component. None if obj's description doesn't know the channel."""
+    description = obj.GetDescription(c4d.DESCFLAGS_DESC_NONE)
+    full = description.CheckDescID(descId, [obj]) if description is not None else None
+    if full is None:
+        return None
+    if kind is not c4d.Vector:
+        return [full]
+    levels = [full[k] for k in range(full.GetDepth())]
+    return [c4d.DescID(*(levels + [c4d.DescLevel(axis, c4d.DTYPE_REAL, 0)]))
+            for axis in (c4d.VECTOR_X, c4d.VECTOR_Y, c4d.VECTOR_Z)]
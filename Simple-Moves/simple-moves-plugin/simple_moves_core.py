@@ -0,0 +1,1274 @@
+"""
+Samplistic Simple Moves - Core
+Author: Delek Miller | Samplistic
+Original Concept: Michael Rosen | Samplistic
+Description: Interpolation engine shared by the Simple Moves tag plugin
+and its commands. Nothing in here touches tag parameters directly; the
+plugin reads its description into a Settings object and hands it over.
+
+Written for Maxon Cinema 4D 2025.7.3
+Python version 3.11.4
+"""
+
+
+import math
+from bisect import bisect_left
+from collections import OrderedDict
+
+import c4d # type: ignore
+from c4d import utils as u # type: ignore
+from c4d.modules import mograph as mo # type: ignore
+
+
+# Plugin IDs of the tags and commands, all in one place. These are Maxon's
+# test range: replace each with an ID registered at plugincafe and set
+# DEVELOPMENT_IDS to False before a release. Saved documents keep the tag
+# IDs, so scenes made with test IDs lose their tags once they change.
+DEVELOPMENT_IDS = True
+PLUGIN_ID_TAG = 1000001
+PLUGIN_ID_CONVERT = 1000002
+PLUGIN_ID_BAKE = 1000003
+PLUGIN_ID_TCB = 1000004
+PLUGIN_ID_EXPORT = 1000005
+PLUGIN_ID_SPLINE = 1000006
+
+# Mode cycle values
+MODE_SIMPLE = 0
+MODE_TOTAL = 1
+
+# Interpolation cycle values
+INTERP_LINEAR = 0
+INTERP_SOFT = 1
+INTERP_TCB = 2
+
+# Simple Moves TCB tag
+TCB_TAG_ID = PLUGIN_ID_TCB
+
+# Tension, continuity, bias of targets without a TCB tag: Catmull-Rom
+DEFAULT_TCB = (0.0, 0.0, 0.0)
+
+
+class Settings(object):
+    """Plain snapshot of the tag parameters used for one evaluation."""
+
+    def __init__(self, mode=MODE_SIMPLE, simple=0.0, total=0.0,
+                 position=True, scale=False, rotation=True, shortest=False,
+                 interpolation=INTERP_LINEAR, softness=0.5, constant_speed=False,
+                 quaternion=False, stagger=0.0, easing=None):
+        self.mode = mode
+        self.simple = simple
+        self.total = total
+        self.position = position
+        self.scale = scale
+        self.rotation = rotation
+        self.shortest = shortest
+        self.quaternion = quaternion
+        self.interpolation = interpolation
+        if softness is None:
+            softness = 0.5
+        # Clamp defensively
+        self.softness = min(max(softness, 0.0), 1.0)
+        self.constant_speed = constant_speed
+        # Slider offset between consecutive driven objects
+        self.stagger = stagger
+        # EasingTable remapping the mix within each segment, None for no easing
+        self.easing = easing
+
+    def key(self):
+        """Every field as a tuple, equal for settings that evaluate the same."""
+        return (self.mode, self.simple, self.total, self.position, self.scale,
+                self.rotation, self.shortest, self.quaternion, self.interpolation,
+                self.softness, self.constant_speed, self.stagger,
+                self.easing.key if self.easing is not None else None)
+
+    def path_softness(self):
+        """Softness the position path actually uses, 0 in linear mode and 1 for TCB."""
+        if self.interpolation == INTERP_SOFT:
+            return self.softness
+        if self.interpolation == INTERP_TCB:
+            return 1.0
+        return 0.0
+
+
+def resolve_targets(data, doc, missing=None):
+    """Returns the objects of an InExcludeData, skipping missing entries.
+
+    Indices of the missing entries are appended to missing if given.
+    """
+    if data is None:
+        return []
+    targets = []
+    for i in range(data.GetObjectCount()):
+        obj = data.ObjectFromIndex(doc, i)
+        if obj is not None:
+            targets.append(obj)
+        elif missing is not None:
+            missing.append(i)
+    return targets
+
+
+class TargetList(object):
+    """Resolved objects of an InExclude parameter, cached on the tag.
+
+    The list is only resolved again when its entry count, the document's
+    object hierarchy (objects added or deleted) or version change. The owner
+    bumps version with invalidate() when the parameter is edited or an
+    undo/redo happens. Entries of deleted objects are removed from the
+    parameter when the list is resolved, not skipped on every frame.
+    """
+
+    def __init__(self):
+        self.objects = []
+        self.version = 0
+        self._key = None
+
+    def invalidate(self):
+        self.version += 1
+
+    def key(self, data, doc):
+        return (data.GetObjectCount(), doc.GetHDirty(c4d.HDIRTYFLAGS_OBJECT_HIERARCHY), self.version)
+
+    def get(self, node, paramId, doc):
+        data = node[paramId]
+        if data is None:
+            return []
+        if self._key is not None and self._key == self.key(data, doc):
+            return self.objects
+        missing = []
+        self.objects = resolve_targets(data, doc, missing)
+        if missing:
+            for i in reversed(missing):
+                data.DeleteObject(i)
+            node[paramId] = data # Store the cleaned list, once
+        self._key = self.key(data, doc)
+        return self.objects
+
+
+class CloneTarget(object):
+    """One MoGraph clone standing in for a target object.
+
+    Has the few BaseObject methods the evaluation calls. GetRelRot() is the
+    clone's rotation inside its generator.
+    """
+
+    __slots__ = ("guid", "genMg", "local", "dirty")
+
+    def __init__(self, guid, genMg, local, dirty):
+        self.guid = guid
+        self.genMg = genMg
+        self.local = local
+        self.dirty = dirty
+
+    def GetGUID(self):
+        return self.guid
+
+    def GetMg(self):
+        return self.genMg * self.local
+
+    def GetUp(self):
+        return None
+
+    def GetDirty(self, flags):
+        return self.dirty
+
+    def GetRelRot(self):
+        return u.MatrixToHPB(self.local)
+
+
+class CloneList(object):
+    """Clones of a generator as a read-only target sequence.
+
+    Holds the matrix array and the indices of the clones in use; the
+    CloneTarget for an index is only made when the evaluation asks for it.
+    """
+
+    def __init__(self, guid, genMg, matrices, indices, dirty):
+        self.guid = guid
+        self.genMg = genMg
+        self.matrices = matrices
+        self.indices = indices
+        self.dirty = dirty
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, k):
+        i = self.indices[k]
+        return CloneTarget((self.guid, i), self.genMg, self.matrices[i], self.dirty)
+
+    def __iter__(self):
+        for k in range(len(self.indices)):
+            yield self[k]
+
+
+class CloneSource(object):
+    """Clones of a MoGraph generator (Cloner, Matrix, ...) as targets, cached on the tag.
+
+    All clone matrices are read with one MoData.GetArray(MODATA_MATRIX)
+    call, and only again when the generator's matrix, its MoData or the
+    selection tag change. Clones that are switched off are left out, as are
+    clones outside the MoGraph selection if one is given.
+    """
+
+    def __init__(self):
+        self.clones = None
+        self.version = 0
+        self._key = None
+
+    def get(self, generator, selection=None):
+        """The clones as a CloneList, None if generator is not a MoGraph object."""
+        if generator is None:
+            return None
+        md = mo.GeGetMoData(generator)
+        if md is None:
+            return None
+        key = (generator.GetGUID(), matrix_dirty(generator), md.GetDirty(), md.GetCount(),
+               selection.GetGUID() if selection is not None else None,
+               selection.GetDirty(c4d.DIRTYFLAGS_DATA) if selection is not None else None)
+        if self._key is not None and self._key == key:
+            return self.clones
+
+        matrices = md.GetArray(c4d.MODATA_MATRIX) or []
+        count = len(matrices)
+        flags = md.GetArray(c4d.MODATA_FLAGS)
+        selected = mo.GeGetMoDataSelection(selection) if selection is not None else None
+        indices = range(count)
+        if flags or selected is not None:
+            indices = [i for i in indices
+                       if (not flags or flags[i] & c4d.MOGENFLAG_CLONE_ON)
+                       and (selected is None or selected.IsSelected(i))]
+        # Every clone gets the new dirty count, TransformCache entries refresh on use
+        self.version += 1
+        self.clones = CloneList(generator.GetGUID(), generator.GetMg(), matrices, indices, self.version)
+        self._key = key
+        return self.clones
+
+
+def get_segment(settings, cnt, offset=0.0):
+    """Maps the Simple Moves / Total slider, minus offset, onto a target index and mix."""
+    if settings.mode == MODE_SIMPLE:
+        data = max(settings.simple - offset, 0.0)
+    else:
+        data = u.RangeMap(settings.total - offset, 0, 1, 0, cnt-1, True)
+    i = int(math.floor(data)) # Calculate current target id
+    mix = data % 1 # Calculate mix value
+    return i, mix
+
+
+def get_scale(m):
+    return c4d.Vector(m.v1.GetLength(), m.v2.GetLength(), m.v3.GetLength())
+
+
+def lerp(start, end, t):
+    return (1 - t) * start + t * end # Custom lerp function
+
+
+# Centripetal Catmull-Rom (alpha=0.5). Gives near-constant visual speed
+# through unevenly spaced control points and avoids loops/cusps near
+# clustered points.
+CENTRIPETAL_ALPHA = 0.5
+KNOT_EPSILON = 1.0e-6
+
+
+def knot_interval(pi, pj):
+    """Parameter distance between two control points."""
+    d = (pj - pi).GetLength()
+    if d < KNOT_EPSILON:
+        return KNOT_EPSILON
+    return math.pow(d, CENTRIPETAL_ALPHA)
+
+
+def centripetal_coefficients(p0, p1, p2, p3):
+    """Cubic coefficients (a, b, c, d) of the p1 -> p2 segment.
+
+    The segment is the Barry-Goldman pyramid rewritten as a Hermite cubic,
+    so evaluating it is a single polynomial: ((a*t + b)*t + c)*t + d with
+    t in [0, 1].
+    """
+    dt0 = knot_interval(p0, p1)
+    dt1 = knot_interval(p1, p2)
+    dt2 = knot_interval(p2, p3)
+
+    # Tangents at p1 and p2, scaled from knot space to t in [0, 1]
+    m1 = ((p1 - p0) / dt0 - (p2 - p0) / (dt0 + dt1) + (p2 - p1) / dt1) * dt1
+    m2 = ((p2 - p1) / dt1 - (p3 - p1) / (dt1 + dt2) + (p3 - p2) / dt2) * dt1
+
+    a = (p1 - p2) * 2.0 + m1 + m2
+    b = (p2 - p1) * 3.0 - m1 * 2.0 - m2
+    return a, b, m1, p1
+
+
+def eval_cubic(coefficients, t):
+    a, b, c, d = coefficients
+    return ((a * t + b) * t + c) * t + d
+
+
+class SplineTable(object):
+    """Knots and per-segment coefficients for a whole target list.
+
+    Built from TargetTransform entries. A target that moves gets a new entry
+    from the TransformCache, so refresh() only has to compare identities to
+    notice it, and then drops the coefficients of the (up to four) segments
+    that use it. Coefficients are filled in on first use, so a frame costs a
+    segment lookup plus one cubic once the table is warm.
+    """
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self.segments = [None] * max(len(self.entries) - 1, 0)
+        self.controls = [None] * len(self.segments)
+        self.tangents = [None] * len(self.segments)
+        self.version = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def refresh(self, k, entry):
+        """Swaps in target k's current entry, invalidating what depends on it."""
+        if self.entries[k] is entry:
+            return
+        self.entries[k] = entry
+        self.invalidate(k)
+
+    def invalidate(self, k):
+        """Drops everything computed from target k."""
+        self.version += 1
+        for s in range(max(k-2, 0), min(k+2, len(self.segments))):
+            self.segments[s] = None
+            self.controls[s] = None
+            self.tangents[s] = None
+
+    def coefficients(self, s):
+        coefficients = self.segments[s]
+        if coefficients is None:
+            coefficients = self.segment_coefficients(s)
+            self.segments[s] = coefficients
+        return coefficients
+
+    def control_indices(self, s):
+        """The four targets segment s is shaped by, repeated at the ends."""
+        last = len(self.entries) - 1
+        return (max(s-1, 0), s, s+1, min(s+2, last))
+
+    def segment_coefficients(self, s):
+        p0, p1, p2, p3 = [self.entries[k].off for k in self.control_indices(s)]
+        return centripetal_coefficients(p0, p1, p2, p3)
+
+    def tangent_weights(self, s):
+        """Tangents at both ends of segment s as weights of its control_indices()."""
+        p0, p1, p2, p3 = [self.entries[k].off for k in self.control_indices(s)]
+        dt0 = knot_interval(p0, p1)
+        dt1 = knot_interval(p1, p2)
+        dt2 = knot_interval(p2, p3)
+        # centripetal_coefficients() tangents, per control point
+        m1 = (dt1 * (1.0 / (dt0 + dt1) - 1.0 / dt0),
+              dt1 * (1.0 / dt0 - 1.0 / dt1),
+              dt1 * (1.0 / dt1 - 1.0 / (dt0 + dt1)),
+              0.0)
+        m2 = (0.0,
+              dt1 * (1.0 / (dt1 + dt2) - 1.0 / dt1),
+              dt1 * (1.0 / dt1 - 1.0 / dt2),
+              dt1 * (1.0 / dt2 - 1.0 / (dt1 + dt2)))
+        return m1, m2
+
+    def evaluate(self, s, t):
+        return eval_cubic(self.coefficients(s), t)
+
+    def weights(self, s, t):
+        """The point evaluate(s, t) as weights of its four control targets.
+
+        Returns (indices, weights), the point is sum(weight * position).
+        Lets values other than positions follow the same spline.
+        """
+        tangents = self.tangents[s]
+        if tangents is None:
+            tangents = (self.control_indices(s),) + self.tangent_weights(s)
+            self.tangents[s] = tangents
+        indices, m1, m2 = tangents
+        # Hermite basis
+        t2 = t * t
+        t3 = t2 * t
+        h00 = 2.0 * t3 - 3.0 * t2 + 1.0
+        h10 = t3 - 2.0 * t2 + t
+        h01 = -2.0 * t3 + 3.0 * t2
+        h11 = t3 - t2
+        weights = [h10 * m1[k] + h11 * m2[k] for k in range(4)]
+        weights[1] += h00
+        weights[2] += h01
+        return indices, weights
+
+    def squad(self, s, t):
+        """Rotation on segment s as a squad through the neighbouring targets."""
+        q1, q2, s1, s2 = self.squad_controls(s)
+        return quat_squad(q1, q2, s1, s2, t)
+
+    def squad_controls(self, s):
+        """(q1, q2, s1, s2) of segment s for quat_squad(), in one hemisphere."""
+        controls = self.controls[s]
+        if controls is None:
+            entries = self.entries
+            last = len(entries) - 1
+            q1 = entries[s].quat
+            q2 = quat_align(entries[s+1].quat, q1)
+            q0 = quat_align(entries[max(s-1, 0)].quat, q1)
+            q3 = quat_align(entries[min(s+2, last)].quat, q2)
+            controls = (q1, q2, squad_control(q0, q1, q2), squad_control(q1, q2, q3))
+            self.controls[s] = controls
+        return controls
+
+
+def tcb_factors(params):
+    """Chord weights of a target's TCB tangents.
+
+    Returns (a, b, c, d): the tangent leaving the target is
+    a * (p - prev) + b * (next - p), the one arriving at it is
+    c * (p - prev) + d * (next - p). All 0.5 is Catmull-Rom.
+    """
+    tension, continuity, bias = params
+    k = (1.0 - tension) * 0.5
+    return (k * (1.0 + bias) * (1.0 + continuity), k * (1.0 - bias) * (1.0 - continuity),
+            k * (1.0 + bias) * (1.0 - continuity), k * (1.0 - bias) * (1.0 + continuity))
+
+
+def tcb_coefficients(p0, p1, p2, p3, params1, params2):
+    """Cubic coefficients of the p1 -> p2 segment with Kochanek-Bartels tangents."""
+    a1, b1, _, _ = tcb_factors(params1)
+    _, _, c2, d2 = tcb_factors(params2)
+    m1 = (p1 - p0) * a1 + (p2 - p1) * b1
+    m2 = (p2 - p1) * c2 + (p3 - p2) * d2
+    a = (p1 - p2) * 2.0 + m1 + m2
+    b = (p2 - p1) * 3.0 - m1 * 2.0 - m2
+    return a, b, m1, p1
+
+
+class TcbTable(SplineTable):
+    """SplineTable with Kochanek-Bartels tangents.
+
+    Every target has its own (tension, continuity, bias). A change to them
+    drops the coefficients of the segments around the target just like
+    moving it, so a frame is still one cubic once the table is warm.
+    """
+
+    def __init__(self, entries):
+        SplineTable.__init__(self, entries)
+        self.params = [DEFAULT_TCB] * len(self.entries)
+
+    def refresh_params(self, k, params):
+        if self.params[k] != params:
+            self.params[k] = params
+            self.invalidate(k)
+
+    def segment_coefficients(self, s):
+        p0, p1, p2, p3 = [self.entries[k].off for k in self.control_indices(s)]
+        return tcb_coefficients(p0, p1, p2, p3, self.params[s], self.params[s+1])
+
+    def tangent_weights(self, s):
+        a1, b1, _, _ = tcb_factors(self.params[s])
+        _, _, c2, d2 = tcb_factors(self.params[s+1])
+        # Same tangents as segment_coefficients(), per control point
+        return (-a1, a1 - b1, b1, 0.0), (0.0, -c2, c2 - d2, d2)
+
+
+def path_position(spline, s, t, softness):
+    """Position on the active path: linear, blended towards the spline by softness."""
+    entries = spline.entries
+    last = len(entries) - 1
+    p1 = entries[min(s, last)].off
+    p2 = entries[min(s+1, last)].off
+    pos_linear = u.MixVec(p1, p2, t)
+    if softness <= 0.0 or s >= last:
+        return pos_linear
+    return u.MixVec(pos_linear, spline.evaluate(s, t), softness)
+
+
+def path_weights(spline, s, t, softness):
+    """path_position() as (target index, weight) pairs: position = sum(weight * target position)."""
+    last = len(spline.entries) - 1
+    if softness <= 0.0 or s >= last:
+        return ((min(s, last), 1.0 - t), (min(s+1, last), t))
+    indices, weights = spline.weights(s, t)
+    weights = [w * softness for w in weights]
+    # Blend with the linear weights like path_position()
+    weights[1] += (1.0 - softness) * (1.0 - t)
+    weights[2] += (1.0 - softness) * t
+    return tuple(zip(indices, weights))
+
+
+class EasingTable(object):
+    """Easing curve sampled at SIZE evenly spaced mix values.
+
+    Built once when the curve is edited. lookup() is an index and one lerp
+    per frame, however the curve was drawn. Values may leave 0..1 for
+    curves that overshoot.
+    """
+
+    SIZE = 128
+
+    def __init__(self, values):
+        self.values = list(values)
+        self.key = hash(tuple(self.values))
+        self._last = len(self.values) - 1
+
+    @classmethod
+    def from_spline(cls, spline, size=SIZE):
+        """Samples a SplineData curve (x = mix in, y = mix out). None without a curve."""
+        if spline is None or spline.GetKnotCount() < 2:
+            return None
+        # The curve parameter is not x, so sample densely and resample by x
+        count = size * 4
+        points = sorted((p.x, p.y) for p in (spline.GetPoint(float(k) / (count - 1)) for k in range(count)))
+        return cls(resample_curve(points, size))
+
+    def lookup(self, t):
+        x = t * self._last
+        if x <= 0.0:
+            return self.values[0]
+        k = int(x)
+        if k >= self._last:
+            return self.values[-1]
+        v0 = self.values[k]
+        return v0 + (self.values[k+1] - v0) * (x - k)
+
+
+def resample_curve(points, size):
+    """y of a curve given as (x, y) points sorted by x, at size evenly spaced x in 0..1."""
+    xs = [p[0] for p in points]
+    values = []
+    for k in range(size):
+        x = float(k) / (size - 1)
+        j = bisect_left(xs, x)
+        if j <= 0:
+            values.append(points[0][1])
+        elif j >= len(points):
+            values.append(points[-1][1])
+        else:
+            (x0, y0), (x1, y1) = points[j-1], points[j]
+            values.append(y0 if x1 - x0 <= 0.0 else y0 + (y1 - y0) * (x - x0) / (x1 - x0))
+    return values
+
+
+class ArcLengthTable(object):
+    """Cumulative length of the active path, for constant speed Total mode.
+
+    Every segment is sampled SAMPLES times (once when the path is linear,
+    where the chord is exact). Looking up a 0..1 slider value is a bisect
+    over the cumulative lengths, so a frame costs O(log n) once the table is
+    built. The table is tied to a SplineTable version and a softness.
+    """
+
+    SAMPLES = 16
+
+    def __init__(self, spline, softness):
+        self.spline = spline
+        self.version = spline.version
+        self.softness = softness
+
+        samples = self.SAMPLES if softness > 0.0 else 1
+        lengths = [0.0]
+        params = [0.0]
+        prev = spline.entries[0].off
+        for s in range(len(spline.segments)):
+            for k in range(1, samples + 1):
+                t = float(k) / samples
+                pos = path_position(spline, s, t, softness)
+                lengths.append(lengths[-1] + (pos - prev).GetLength())
+                params.append(s + t)
+                prev = pos
+        self.lengths = lengths
+        self.params = params
+
+    def is_valid(self, spline, softness):
+        return self.spline is spline and self.version == spline.version and self.softness == softness
+
+    def lookup(self, total):
+        """Maps a 0..1 share of the path length onto a target index + mix value."""
+        lengths = self.lengths
+        length = lengths[-1]
+        if length <= 0.0:
+            return total * (len(self.spline) - 1)
+        target = min(max(total, 0.0), 1.0) * length
+        k = bisect_left(lengths, target)
+        if k <= 0:
+            return self.params[0]
+        if k >= len(lengths):
+            return self.params[-1]
+        l0 = lengths[k-1]
+        l1 = lengths[k]
+        p0 = self.params[k-1]
+        if l1 - l0 <= 0.0:
+            return p0
+        return p0 + (self.params[k] - p0) * (target - l0) / (l1 - l0)
+
+
+class PathPreview(object):
+    """Polyline of the whole path for drawing in the viewport.
+
+    Linear segments are a single line. Soft segments are split in halves
+    until the middle of every piece lies within tolerance (relative to the
+    segment's chord) of the straight line, so straight stretches stay cheap
+    and tight bends get more points. params holds the path parameter
+    (segment + mix) of every point. Like ArcLengthTable it is tied to a
+    SplineTable version and a softness.
+    """
+
+    TOLERANCE = 0.002
+    MIN_DEPTH = 2
+    MAX_DEPTH = 7
+
+    def __init__(self, spline, softness, tolerance=TOLERANCE):
+        self.spline = spline
+        self.version = spline.version
+        self.softness = softness
+        self.tolerance = tolerance
+
+        points = [spline.entries[0].off] if len(spline) else []
+        params = [0.0] if len(spline) else []
+        for s in range(len(spline.segments)):
+            p0 = path_position(spline, s, 0.0, softness)
+            p1 = path_position(spline, s, 1.0, softness)
+            if softness > 0.0:
+                segmentTolerance = max((p1 - p0).GetLength() * tolerance, KNOT_EPSILON)
+                self._subdivide(s, 0.0, p0, 1.0, p1, segmentTolerance, 0, points, params)
+            points.append(p1)
+            params.append(s + 1.0)
+        self.points = points
+        self.params = params
+
+    def _subdivide(self, s, t0, p0, t1, p1, tolerance, depth, points, params):
+        """Appends the points strictly between t0 and t1 on segment s."""
+        if depth >= self.MAX_DEPTH:
+            return
+        tm = (t0 + t1) * 0.5
+        pm = path_position(self.spline, s, tm, self.softness)
+        if depth >= self.MIN_DEPTH and (pm - (p0 + p1) * 0.5).GetLength() <= tolerance:
+            return
+        self._subdivide(s, t0, p0, tm, pm, tolerance, depth + 1, points, params)
+        points.append(pm)
+        params.append(s + tm)
+        self._subdivide(s, tm, pm, t1, p1, tolerance, depth + 1, points, params)
+
+    def is_valid(self, spline, softness):
+        return self.spline is spline and self.version == spline.version and self.softness == softness
+
+
+# Quaternions are plain (w, x, y, z) tuples, kept unit length.
+QUAT_IDENTITY = (1.0, 0.0, 0.0, 0.0)
+
+
+def quat_normalize(q):
+    w, x, y, z = q
+    n = math.sqrt(w*w + x*x + y*y + z*z)
+    if n < 1.0e-12:
+        return QUAT_IDENTITY
+    return (w/n, x/n, y/n, z/n)
+
+
+def quat_from_matrix(m):
+    """Rotation of a matrix as a unit quaternion, scale is ignored."""
+    v1 = m.v1.GetNormalized()
+    v2 = m.v2.GetNormalized()
+    v3 = m.v3.GetNormalized()
+    trace = v1.x + v2.y + v3.z
+    if trace > 0.0:
+        s = math.sqrt(trace + 1.0) * 2.0
+        q = (0.25 * s, (v2.z - v3.y) / s, (v3.x - v1.z) / s, (v1.y - v2.x) / s)
+    elif v1.x > v2.y and v1.x > v3.z:
+        s = math.sqrt(1.0 + v1.x - v2.y - v3.z) * 2.0
+        q = ((v2.z - v3.y) / s, 0.25 * s, (v2.x + v1.y) / s, (v3.x + v1.z) / s)
+    elif v2.y > v3.z:
+        s = math.sqrt(1.0 + v2.y - v1.x - v3.z) * 2.0
+        q = ((v3.x - v1.z) / s, (v2.x + v1.y) / s, 0.25 * s, (v3.y + v2.z) / s)
+    else:
+        s = math.sqrt(1.0 + v3.z - v1.x - v2.y) * 2.0
+        q = ((v1.y - v2.x) / s, (v3.x + v1.z) / s, (v3.y + v2.z) / s, 0.25 * s)
+    return quat_normalize(q)
+
+
+def quat_axes(q):
+    """The three unit axes (v1, v2, v3) of a rotation quaternion."""
+    w, x, y, z = q
+    return (c4d.Vector(1.0 - 2.0*(y*y + z*z), 2.0*(x*y + w*z), 2.0*(x*z - w*y)),
+            c4d.Vector(2.0*(x*y - w*z), 1.0 - 2.0*(x*x + z*z), 2.0*(y*z + w*x)),
+            c4d.Vector(2.0*(x*z + w*y), 2.0*(y*z - w*x), 1.0 - 2.0*(x*x + y*y)))
+
+
+def quat_dot(a, b):
+    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2] + a[3]*b[3]
+
+
+def quat_mul(a, b):
+    aw, ax, ay, az = a
+    bw, bx, by, bz = b
+    return (aw*bw - ax*bx - ay*by - az*bz,
+            aw*bx + ax*bw + ay*bz - az*by,
+            aw*by - ax*bz + ay*bw + az*bx,
+            aw*bz + ax*by - ay*bx + az*bw)
+
+
+def quat_conjugate(q):
+    return (q[0], -q[1], -q[2], -q[3])
+
+
+def quat_log(q):
+    w, x, y, z = q
+    n = math.sqrt(x*x + y*y + z*z)
+    if n < 1.0e-12:
+        return (0.0, 0.0, 0.0, 0.0)
+    f = math.atan2(n, w) / n
+    return (0.0, x*f, y*f, z*f)
+
+
+def quat_exp(q):
+    _, x, y, z = q
+    n = math.sqrt(x*x + y*y + z*z)
+    if n < 1.0e-12:
+        return QUAT_IDENTITY
+    f = math.sin(n) / n
+    return (math.cos(n), x*f, y*f, z*f)
+
+
+def quat_slerp(a, b, t, shortest=True):
+    """Spherical interpolation, along the shorter arc unless told otherwise."""
+    dot = quat_dot(a, b)
+    if shortest and dot < 0.0:
+        b = (-b[0], -b[1], -b[2], -b[3])
+        dot = -dot
+    if abs(dot) > 0.9995:
+        # Nearly parallel, lerp is accurate and avoids dividing by ~0
+        return quat_normalize(tuple(a[k] + (b[k] - a[k]) * t for k in range(4)))
+    theta = math.acos(max(dot, -1.0))
+    s = math.sin(theta)
+    fa = math.sin((1.0 - t) * theta) / s
+    fb = math.sin(t * theta) / s
+    return (a[0]*fa + b[0]*fb, a[1]*fa + b[1]*fb, a[2]*fa + b[2]*fb, a[3]*fa + b[3]*fb)
+
+
+def quat_align(q, ref):
+    """q or -q, whichever lies in ref's hemisphere."""
+    if quat_dot(q, ref) < 0.0:
+        return (-q[0], -q[1], -q[2], -q[3])
+    return q
+
+
+def squad_control(q0, q1, q2):
+    """Inner control quaternion of q1 for squad, neighbours already aligned."""
+    inv = quat_conjugate(q1)
+    l0 = quat_log(quat_mul(inv, q0))
+    l2 = quat_log(quat_mul(inv, q2))
+    return quat_mul(q1, quat_exp(tuple(-(l0[k] + l2[k]) * 0.25 for k in range(4))))
+
+
+def quat_squad(q1, q2, s1, s2, t):
+    # The inputs are already in one hemisphere. Flipping inside the nested
+    # slerps would pick different arcs and make the curve jump.
+    return quat_slerp(quat_slerp(q1, q2, t, False), quat_slerp(s1, s2, t, False),
+                      2.0 * t * (1.0 - t), False)
+
+
+def matrix_dirty(obj):
+    """Dirty counter for obj's global matrix.
+
+    DIRTYFLAGS_MATRIX only counts changes to the object's own matrix, so the
+    parents are summed in as well. The counters only ever go up, so the sum
+    changes whenever any of them does.
+    """
+    dirty = 0
+    while obj is not None:
+        dirty += obj.GetDirty(c4d.DIRTYFLAGS_MATRIX)
+        obj = obj.GetUp()
+    return dirty
+
+
+class TargetTransform(object):
+    """A target's global matrix, decomposed once per change."""
+
+    __slots__ = ("dirty", "mg", "off", "scale", "hpb", "relrot", "quat")
+
+    def __init__(self, obj, dirty):
+        mg = obj.GetMg()
+        self.dirty = dirty
+        self.mg = mg
+        self.off = mg.off
+        self.scale = get_scale(mg)
+        self.hpb = u.MatrixToHPB(mg)
+        self.relrot = obj.GetRelRot()
+        self.quat = quat_from_matrix(mg)
+
+
+class ObjectCache(object):
+    """Entries keyed on the object's GUID, for the caches of the Evaluator."""
+
+    def __init__(self):
+        self._entries = {}
+
+    def prune(self, targets):
+        """Drops entries for objects that are no longer targets."""
+        keep = set(obj.GetGUID() for obj in targets)
+        for key in [k for k in self._entries if k not in keep]:
+            del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class TransformCache(ObjectCache):
+    """Decomposed target transforms keyed on the object, refreshed by dirty count."""
+
+    def get(self, obj):
+        key = obj.GetGUID()
+        dirty = matrix_dirty(obj)
+        entry = self._entries.get(key)
+        if entry is None or entry.dirty != dirty:
+            entry = TargetTransform(obj, dirty)
+            self._entries[key] = entry
+        return entry
+
+
+def tcb_dirty(obj):
+    """Data dirty count of obj's TCB tag, -1 if it has none."""
+    if isinstance(obj, CloneTarget):
+        return -1
+    tag = obj.GetTag(TCB_TAG_ID)
+    return tag.GetDirty(c4d.DIRTYFLAGS_DATA) if tag is not None else -1
+
+
+class TcbCache(ObjectCache):
+    """(tension, continuity, bias) of targets keyed on the object, reread when their TCB tag changes."""
+
+    def get(self, obj):
+        """(dirty, params) of obj, see tcb_dirty()."""
+        key = obj.GetGUID()
+        dirty = tcb_dirty(obj)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != dirty:
+            params = DEFAULT_TCB
+            if dirty >= 0:
+                tag = obj.GetTag(TCB_TAG_ID)
+                params = (tag[c4d.SIMPLEMOVES_TCB_TENSION], tag[c4d.SIMPLEMOVES_TCB_CONTINUITY],
+                          tag[c4d.SIMPLEMOVES_TCB_BIAS])
+            entry = (dirty, params)
+            self._entries[key] = entry
+        return entry
+
+
+# Largest per-component difference that still counts as the same matrix
+MATRIX_EPSILON = 1.0e-6
+
+
+def matrix_equal(a, b, eps=MATRIX_EPSILON):
+    for va, vb in ((a.off, b.off), (a.v1, b.v1), (a.v2, b.v2), (a.v3, b.v3)):
+        if abs(va.x - vb.x) > eps or abs(va.y - vb.y) > eps or abs(va.z - vb.z) > eps:
+            return False
+    return True
+
+
+def relative_basis(obj):
+    """Frame a relative rotation of obj lives in: its parent, then its frozen rotation.
+
+    Returns (matrix, rotation order). Multiplying the matrix with the
+    rotation's matrix gives the global axes SetRelRot() would produce.
+    """
+    order = obj[c4d.ID_BASEOBJECT_ROTATION_ORDER]
+    return obj.GetUpMg() * u.HPBToMatrix(obj.GetFrozenRot(), order), order
+
+
+def basis_key(obj):
+    """Everything relative_basis(obj) depends on."""
+    frozen = obj.GetFrozenRot()
+    return (matrix_dirty(obj.GetUp()), frozen.x, frozen.y, frozen.z, obj[c4d.ID_BASEOBJECT_ROTATION_ORDER])
+
+
+def vector_key(v):
+    return (v.x, v.y, v.z)
+
+
+class FrameMemo(object):
+    """Bounded LRU of composed matrices.
+
+    Keyed on everything an evaluation reads besides the targets. Each
+    entry also remembers the targets the evaluation used (index, GUID,
+    matrix dirty count, TCB tag dirty count or None if it didn't read it),
+    and a lookup only returns it while they are all unchanged, so moving a
+    target or editing the list invalidates exactly the frames that depended
+    on it.
+
+    size is SIZE entries per driven object, up to LIMIT, since each one
+    adds an entry per frame. fit() sets it for the count of the tag.
+    """
+
+    SIZE = 256
+    LIMIT = 16384
+
+    def __init__(self, size=SIZE):
+        self.base = size
+        self.size = size
+        self._entries = OrderedDict()
+
+    def fit(self, count):
+        """Sizes the memo for count driven objects, dropping the oldest entries if it shrinks."""
+        if self.base <= 0:
+            return
+        self.size = min(self.base * max(count, 1), self.LIMIT)
+        entries = self._entries
+        while len(entries) > self.size:
+            entries.popitem(last=False)
+
+    def get(self, key, targets):
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        m, deps = item
+        for k, guid, dirty, tcbDirty in deps:
+            obj = targets[k]
+            if obj.GetGUID() != guid or matrix_dirty(obj) != dirty:
+                del self._entries[key]
+                return None
+            if tcbDirty is not None and tcb_dirty(obj) != tcbDirty:
+                del self._entries[key]
+                return None
+        self._entries.move_to_end(key)
+        return m
+
+    def put(self, key, m, deps):
+        if self.size <= 0:
+            return
+        entries = self._entries
+        entries[key] = (m, deps)
+        entries.move_to_end(key)
+        while len(entries) > self.size:
+            entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def unit_axes(m):
+    return m.v1.GetNormalized(), m.v2.GetNormalized(), m.v3.GetNormalized()
+
+
+def global_rotation_axes(r1, r2, factor):
+    oa = u.GetOptimalAngle(r1, r2, c4d.ROTATIONORDER_DEFAULT) # Get optimal angle
+    rot = u.MixVec(r1, oa, factor) # Mix rotation
+    return unit_axes(u.HPBToMatrix(rot))
+
+
+def basic_rotation_axes(basis, rot1, rot2, factor):
+    mixH = lerp(rot1[0], rot2[0], factor) # Get y-axis rotation
+    mixP = lerp(rot1[1], rot2[1], factor) # Get x-axis rotation
+    mixB = lerp(rot1[2], rot2[2], factor) # Get z-axis rotation
+
+    frame, order = basis
+    return unit_axes(frame * u.HPBToMatrix(c4d.Vector(mixH, mixP, mixB), order))
+
+
+def scene_signature(targets, spline):
+    """Document dirty counts that change whenever a target may have moved.
+
+    None when there is no document to ask, e.g. for clones, then every
+    target has to be checked.
+    """
+    if not len(targets) or isinstance(targets, CloneList):
+        return None
+    doc = targets[0].GetDocument()
+    if doc is None:
+        return None
+    signature = (doc.GetHDirty(c4d.HDIRTYFLAGS_OBJECT_MATRIX), doc.GetHDirty(c4d.HDIRTYFLAGS_OBJECT_HIERARCHY))
+    if isinstance(spline, TcbTable):
+        # TCB tags are read too
+        signature += (doc.GetHDirty(c4d.HDIRTYFLAGS_TAG),)
+    return signature
+
+
+class Evaluator(object):
+    """Per-tag evaluation state. One instance lives on each tag plugin."""
+
+    def __init__(self, memoSize=FrameMemo.SIZE):
+        self.transforms = TransformCache()
+        self.tcb = TcbCache()
+        self.spline = None
+        self.tcb_spline = None
+        self.arc_length = None
+        self.preview = None
+        self.memo = FrameMemo(memoSize)
+        self._bases = {}
+        # Targets read by the compose() in progress, index -> [GUID, dirty, TCB dirty]
+        self._used = None
+        # Target entries fixed for compose_samples(), index -> TargetTransform
+        self._frame = None
+        self._frameFull = False
+        # Bumped whenever full_spline_table() finds the path changed
+        self.full_version = 0
+        # (spline, targets, scene_signature()) of the last full refresh
+        self._full = None
+        # GUIDs of the parents of the targets, moving one moves a target
+        self._fullParents = frozenset()
+
+    def evaluate(self, obj, targets, settings, index=0):
+        """Drives obj along targets, index staggers behind the first driven object.
+
+        The new matrix is composed in memory and written with a single
+        SetMg(), and not at all when it matches the current one, so nothing
+        below obj gets rebuilt while it stands still. Returns True if obj was
+        written.
+
+        Results are memoized: revisiting a slider position with unchanged
+        targets is a dictionary lookup plus a dirty check of the targets it
+        used.
+        """
+        if obj is None:
+            return False
+        current = obj.GetMg()
+        basis = basisKey = None
+        if settings.rotation and not settings.quaternion and not settings.shortest:
+            basisKey, basis = self._basis(obj)
+        # Channels the tag does not drive are copied from the current matrix,
+        # only those parts of it go into the key
+        passthrough = (None if settings.position else vector_key(current.off),
+                       None if settings.scale else vector_key(get_scale(current)),
+                       None if settings.rotation else tuple(vector_key(v) for v in unit_axes(current)))
+        # Constant speed reads the whole path, the segment's targets alone
+        # don't tell if an entry is still valid
+        fullVersion = None
+        if settings.mode == MODE_TOTAL and settings.constant_speed and len(targets) > 1:
+            self.full_spline_table(targets, settings.interpolation)
+            fullVersion = self.full_version
+        key = (obj.GetGUID(), index, len(targets), settings.key(), basisKey, passthrough, fullVersion)
+
+        m = self.memo.get(key, targets)
+        if m is None:
+            self._used = {}
+            try:
+                m = self.compose(current, targets, settings, basis, index)
+                deps = tuple((k,) + tuple(used) for k, used in self._used.items())
+            finally:
+                self._used = None
+            if m is None:
+                return False
+            self.memo.put(key, m, deps)
+        if matrix_equal(m, current):
+            return False
+        full = self._full
+        fresh = full is not None and full[1] is targets and obj.GetGUID() not in self._fullParents \
+            and full[2] is not None and full[2] == scene_signature(targets, full[0])
+        obj.SetMg(m)
+        if fresh:
+            # Moving obj moved no target, so the path is still up to date
+            self._full = (full[0], targets, scene_signature(targets, full[0]))
+        return True
+
+    def prune(self, driven):
+        """Drops the cached bases of objects that are no longer driven, fits the memo to them."""
+        self.memo.fit(len(driven))
+        bases = self._bases
+        if len(bases) <= len(driven):
+            return
+        keep = set(obj.GetGUID() for obj in driven)
+        for key in [k for k in bases if k not in keep]:
+            del bases[key]
+
+    def _basis(self, obj):
+        """(key, relative_basis(obj)), cached until the parent or the frozen rotation change."""
+        key = basis_key(obj)
+        cached = self._bases.get(obj.GetGUID())
+        if cached is None or cached[0] != key:
+            cached = (key, relative_basis(obj))
+            self._bases[obj.GetGUID()] = cached
+        return cached
+
+    def _target(self, targets, k):
+        """Transform of target k, noted as used by the compose() in progress."""
+        frame = self._frame
+        if frame is not None:
+            entry = frame.get(k)
+            if entry is not None:
+                return entry
+        obj = targets[k]
+        entry = self.transforms.get(obj)
+        if frame is not None:
+            frame[k] = entry
+        if self._used is not None and k not in self._used:
+            self._used[k] = [obj.GetGUID(), entry.dirty, None]
+        return entry
+
+    def _tcb(self, targets, k):
+        """TCB params of target k, noted as used like _target()."""
+        dirty, params = self.tcb.get(targets[k])
+        if self._used is not None:
+            used = self._used.get(k)
+            if used is None:
+                self._target(targets, k)
+                used = self._used[k]
+            used[2] = dirty
+        return params
+
+    def compose(self, current, targets, settings, basis=None, index=0):
+        """New global matrix for an object currently at current, None without targets.
+
+        basis is the relative_basis() of the object, only needed for the
+        basic (relative Euler) rotation mode. index is the object's place in
+        the driven objects, it trails the first one by index * stagger.
+        """
+        cnt = len(targets)
+        if cnt == 0:
+            return None
+        transforms = self.transforms
+        if len(transforms) > cnt:
+            transforms.prune(targets)
+        if len(self.tcb) > cnt:
+            self.tcb.prune(targets)
+
+        a, b, mix = self.segment(targets, settings, index)
+        ta = self._target(targets, a)
+        tb = self._target(targets, b)
+
+        off = current.off
+        if settings.position:
+            off = u.MixVec(ta.off, tb.off, mix)
+            softness = settings.path_softness()
+            if softness > 0.0 and a != b:
+                pos_spline = self.spline_table(targets, a, settings.interpolation).evaluate(a, mix)
+                # Blend: 0 softness = linear, 1 softness = full spline
+                off = u.MixVec(off, pos_spline, softness)
+
+        if settings.scale:
+            scale = u.MixVec(ta.scale, tb.scale, mix)
+        else:
+            scale = get_scale(current)
+
+        if settings.rotation:
+            if settings.quaternion:
+                q = quat_slerp(ta.quat, tb.quat, mix)
+                softness = settings.path_softness()
+                if softness > 0.0 and a != b:
+                    q = quat_slerp(q, self.spline_table(targets, a, settings.interpolation).squad(a, mix), softness)
+                axes = quat_axes(q) # Unit axes, no HPB round trip
+            elif settings.shortest:
+                axes = global_rotation_axes(ta.hpb, tb.hpb, mix)
+            else:
+                axes = basic_rotation_axes(basis, ta.relrot, tb.relrot, mix)
+        else:
+            axes = unit_axes(current)
+
+        return c4d.Matrix(off, axes[0] * scale.x, axes[1] * scale.y, axes[2] * scale.z)
+
+    def compose_samples(self, current, targets, samples, basis=None, index=0):
+        """compose() for a list of settings, e.g. the sub-frame times of one frame.
+
+        The targets are taken to stand still for the duration: each one is
+        looked up once for all samples, so after the first sample a sample
+        is the segment lookup plus the cached segment's polynomial and the
+        rotation blend.
+        """
+        self._frame = {}
+        self._frameFull = False
+        try:
+            return [self.compose(current, targets, settings, basis, index) for settings in samples]
+        finally:
+            self._frame = None
+            self._frameFull = False
+
+    def segment(self, targets, settings, index=0):
+        """Targets (a, b) and mix of the current segment, for a non-empty target list."""
+        cnt = len(targets)
+        offset = index * settings.stagger
+        if settings.mode == MODE_TOTAL and settings.constant_speed and cnt > 1:
+            data = self.arc_length_table(targets, settings).lookup(settings.total - offset)
+            i = int(math.floor(data))
+            mix = data % 1
+        else:
+            i, mix = get_segment(settings, cnt, offset)
+        # Past the last target both ends of the segment are the last target
+        a = min(i, cnt-1)
+        b = min(i+1, cnt-1)
+        if i >= cnt-1:
+            mix = 0.0
+        elif settings.easing is not None:
+            mix = settings.easing.lookup(mix)
+        return a, b, mix
+
+    def segment_weights(self, targets, settings, a, b, mix):
+        """(target index, weight) pairs of the path point for segment() a, b, mix."""
+        softness = settings.path_softness()
+        if softness > 0.0 and a != b:
+            return path_weights(self.spline_table(targets, a, settings.interpolation), a, mix, softness)
+        return ((a, 1.0 - mix), (b, mix))
+
+    def spline_table(self, targets, s, interpolation=INTERP_SOFT):
+        """Returns the spline table with segment s's control points up to date.
+
+        INTERP_TCB gets a TcbTable of its own, with the targets' TCB params
+        refreshed along with their transforms.
+        """
+        cnt = len(targets)
+        tcb = interpolation == INTERP_TCB
+        spline = self.tcb_spline if tcb else self.spline
+        if spline is None or len(spline) != cnt:
+            spline = (TcbTable if tcb else SplineTable)(self.transforms.get(obj) for obj in targets)
+            if tcb:
+                self.tcb_spline = spline
+            else:
+                self.spline = spline
+        for k in range(max(s-1, 0), min(s+3, cnt)):
+            spline.refresh(k, self._target(targets, k))
+            if tcb:
+                spline.refresh_params(k, self._tcb(targets, k))
+        return spline
+
+    def arc_length_table(self, targets, settings):
+        """Returns the arc length table, rebuilt only if a target or the softness changed."""
+        spline = self.full_spline_table(targets, settings.interpolation)
+        softness = settings.path_softness()
+        table = self.arc_length
+        if table is None or not table.is_valid(spline, softness):
+            table = ArcLengthTable(spline, softness)
+            self.arc_length = table
+        return table
+
+    def full_spline_table(self, targets, interpolation=INTERP_SOFT):
+        """Returns the spline table with every target up to date.
+
+        Checking every target is O(n), so it is skipped while the document's
+        matrix and hierarchy dirty counts (and tag dirty count for TCB) are
+        where the last check left them. evaluate() moves them on past its
+        own writes. full_version changes whenever the path did.
+        """
+        spline = self.spline_table(targets, 0, interpolation)
+        if self._frameFull:
+            return spline
+        signature = scene_signature(targets, spline)
+        full = self._full
+        if full is not None and signature is not None and full[0] is spline and full[1] is targets \
+                and full[2] == signature:
+            return spline
+        version = spline.version
+        # The whole path matters here, not just one segment's window
+        tcb = interpolation == INTERP_TCB
+        parents = set()
+        for k, obj in enumerate(targets):
+            spline.refresh(k, self.transforms.get(obj))
+            if tcb:
+                spline.refresh_params(k, self.tcb.get(obj)[1])
+            if signature is not None:
+                up = obj.GetUp()
+                while up is not None:
+                    parents.add(up.GetGUID())
+                    up = up.GetUp()
+        if full is None or full[0] is not spline or spline.version != version:
+            self.full_version += 1
+        self._full = (spline, targets, signature)
+        self._fullParents = frozenset(parents)
+        self._frameFull = self._frame is not None
+        return spline
+
+    def path_preview(self, targets, settings):
+        """Returns the path polyline, rebuilt only if a target or the softness changed."""
+        spline = self.full_spline_table(targets, settings.interpolation)
+        softness = settings.path_softness()
+        preview = self.preview
+        if preview is None or not preview.is_valid(spline, softness):
+            preview = PathPreview(spline, softness)
+            self.preview = preview
+        return preview
@@ -0,0 +1,189 @@
+"""
+Samplistic Simple Moves - Export
+Author: Delek Miller | Samplistic
+Description: Streams the global matrices of the objects Simple Moves tags
+drive over a frame range to CSV, JSON Lines or a little-endian float32
+binary file. Every stage is a generator: a frame is evaluated, formatted
+and written before the next one is looked at, so memory use stays the same
+however long the range is.
+
+A track is one driven object of one tag. Every format writes the matrix
+of each track for each frame, in Cinema 4D's world space and units, as 12
+numbers: off, v1, v2, v3.
+
+    .csv    frame,tag,object,off.x,off.y,off.z,v1.x,...,v3.z
+    .jsonl  {"frame": 0, "tag": "...", "object": "...", "matrix": [12 numbers]}
+    .bin    header, then every frame as track count * 12 float32
+
+Binary header, little-endian:
+    4s      b"SMTR"
+    uint32  version, 1
+    uint32  track count
+    int32   first frame
+    uint32  frame count
+    float32 frames per second
+    then per track: uint16 byte length + UTF-8 "tag/object" name
+
+Written for Maxon Cinema 4D 2025.7.3
+Python version 3.11.4
+"""
+
+
+import csv
+import json
+import os
+import struct
+
+import c4d # type: ignore
+
+import simple_moves_core as core
+import simple_moves_tags as tags
+import simple_moves_bake as bake
+
+
+BINARY_MAGIC = b"SMTR"
+BINARY_VERSION = 1
+
+MATRIX_COLUMNS = ["%s.%s" % (v, axis) for v in ("off", "v1", "v2", "v3") for axis in "xyz"]
+MATRIX_STRUCT = struct.Struct("<12f")
+
+
+class Track(object):
+    """One driven object of one tag."""
+
+    def __init__(self, tag, obj, index, targets, evaluator):
+        self.tag = tag
+        self.obj = obj
+        self.index = index
+        self.targets = targets
+        self.evaluator = evaluator
+        self.animated = any(bake.is_animated(t) for t in targets) or bake.is_animated(obj, ignore=tag)
+
+    @property
+    def name(self):
+        return "%s/%s" % (self.tag.GetName(), self.obj.GetName())
+
+
+def get_tracks(doc, exportTags):
+    """Tracks of every tag that has targets, grouped by tag in tag order."""
+    tracks = []
+    for tag in exportTags:
+        targets = tags.get_targets(tag, doc)
+        if not targets:
+            continue
+        # Driven objects of one tag share its evaluator and target caches
+        evaluator = core.Evaluator()
+        for index, obj in enumerate(tags.get_driven_objects(tag, doc, targets)):
+            tracks.append(Track(tag, obj, index, targets, evaluator))
+    return tracks
+
+
+def frame_range(doc):
+    """First and last frame of the document's range."""
+    fps = doc.GetFps()
+    return doc.GetMinTime().GetFrame(fps), doc.GetMaxTime().GetFrame(fps)
+
+
+def iter_times(doc, first, last):
+    fps = doc.GetFps()
+    return (c4d.BaseTime(frame, fps) for frame in range(first, last + 1))
+
+
+def iter_frames(doc, tracks, first, last):
+    """Yields (frame, matrices) for every frame, one global matrix per track.
+
+    If nothing the tracks depend on is animated the slider tracks are
+    sampled and the matrices composed without touching the document, like
+    static baking. Otherwise the document is run once per frame for all
+    tracks together and put back at its current time afterwards.
+    """
+    if not any(track.animated for track in tracks):
+        yield from iter_static_frames(doc, tracks, first, last)
+        return
+
+    current = doc.GetTime()
+    try:
+        for frame, time in enumerate(iter_times(doc, first, last), first):
+            doc.SetTime(time)
+            doc.ExecutePasses(None, True, True, True, c4d.BUILDFLAGS_NONE)
+            yield frame, [track.obj.GetMg() for track in tracks]
+    finally:
+        doc.SetTime(current)
+        doc.ExecutePasses(None, True, True, True, c4d.BUILDFLAGS_NONE)
+
+
+def iter_static_frames(doc, tracks, first, last):
+    # Per tag a generator of its settings, advanced once per frame for all its tracks
+    groups = []
+    for track in tracks:
+        member = (track, track.obj.GetMg(), core.relative_basis(track.obj))
+        if groups and groups[-1][0] is track.tag:
+            groups[-1][2].append(member)
+            continue
+        easing = tags.read_easing(track.tag)
+        settings = (core.Settings(easing=easing, **values)
+                    for values in bake.iter_values(doc, track.tag, iter_times(doc, first, last)))
+        groups.append((track.tag, settings, [member]))
+
+    for frame in range(first, last + 1):
+        matrices = []
+        for _, settings, members in groups:
+            frameSettings = next(settings)
+            for track, start, basis in members:
+                m = track.evaluator.compose(start, track.targets, frameSettings, basis, track.index)
+                matrices.append(m if m is not None else start)
+        yield frame, matrices
+
+
+def matrix_values(m):
+    return (m.off.x, m.off.y, m.off.z, m.v1.x, m.v1.y, m.v1.z,
+            m.v2.x, m.v2.y, m.v2.z, m.v3.x, m.v3.y, m.v3.z)
+
+
+def csv_rows(tracks, frames):
+    yield ["frame", "tag", "object"] + MATRIX_COLUMNS
+    for frame, matrices in frames:
+        for track, m in zip(tracks, matrices):
+            yield [frame, track.tag.GetName(), track.obj.GetName()] + list(matrix_values(m))
+
+
+def jsonl_lines(tracks, frames):
+    for frame, matrices in frames:
+        for track, m in zip(tracks, matrices):
+            yield json.dumps({"frame": frame, "tag": track.tag.GetName(), "object": track.obj.GetName(),
+                              "matrix": matrix_values(m)}) + "\n"
+
+
+def binary_chunks(tracks, frames, first, count, fps):
+    names = [track.name.encode("utf-8")[:0xFFFF] for track in tracks]
+    yield struct.pack("<4sIIiIf", BINARY_MAGIC, BINARY_VERSION, len(tracks), first, count, fps)
+    for name in names:
+        yield struct.pack("<H", len(name)) + name
+    pack = MATRIX_STRUCT.pack
+    for _, matrices in frames:
+        yield b"".join(pack(*matrix_values(m)) for m in matrices)
+
+
+def export_tags(doc, exportTags, path, first=None, last=None):
+    """Writes the tags' trajectories to path, format by extension. Returns the number of tracks."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in (".csv", ".jsonl", ".bin"):
+        raise ValueError("Unknown export format %r, use .csv, .jsonl or .bin" % ext)
+    tracks = get_tracks(doc, exportTags)
+    if not tracks:
+        return 0
+    start, end = frame_range(doc)
+    first = start if first is None else first
+    last = end if last is None else last
+    frames = iter_frames(doc, tracks, first, last)
+
+    if ext == ".csv":
+        with open(path, "w", newline="") as f:
+            csv.writer(f).writerows(csv_rows(tracks, frames))
+    elif ext == ".jsonl":
+        with open(path, "w") as f:
+            f.writelines(jsonl_lines(tracks, frames))
+    else:
+        with open(path, "wb") as f:
+            f.writelines(binary_chunks(tracks, frames, first, max(last - first + 1, 0), doc.GetFps()))
+    return len(tracks)
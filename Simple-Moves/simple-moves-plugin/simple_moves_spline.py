@@ -0,0 +1,151 @@
+"""
+Samplistic Simple Moves - Spline
+Author: Delek Miller | Samplistic
+Description: Turns the path of a Simple Moves tag into a native linear
+spline object, so heavy shots can play back with Cinema 4D's own Align to
+Spline tag instead of a Python evaluation per frame.
+
+The points come from the same adaptive subdivision as Show Path: linear
+segments are one line, soft and TCB segments are split until every piece
+is within the tolerance of the curve, relative to the segment's length. So
+straight stretches stay two points and tight bends get more.
+
+replace_tag() goes one step further: every driven object gets an Align to
+Spline tag whose Position is keyed for every frame of the document, so
+easing, Constant Speed and Stagger carry over. Scale, Rotation and the
+Channels, which a spline can't hold, are baked to keys like the Bake
+command does, and the Simple Moves tag is disabled.
+
+Written for Maxon Cinema 4D 2025.7.3
+Python version 3.11.4
+"""
+
+
+from bisect import bisect_right
+
+import c4d # type: ignore
+
+import simple_moves_core as core
+import simple_moves_tags as tags
+import simple_moves_bake as bake
+import simple_moves_channels as channels
+
+
+DEFAULT_TOLERANCE = core.PathPreview.TOLERANCE
+
+
+def build_path(evaluator, targets, settings, tolerance=DEFAULT_TOLERANCE):
+    """PathPreview of the tag's path at the given tolerance."""
+    spline = evaluator.full_spline_table(targets, settings.interpolation)
+    return core.PathPreview(spline, settings.path_softness(), tolerance)
+
+
+def make_spline_object(path, name):
+    """Linear SplineObject through the path points, in global space."""
+    spline = c4d.SplineObject(len(path.points), c4d.SPLINETYPE_LINEAR)
+    spline.SetName(name)
+    spline.SetAllPoints(path.points)
+    spline.Message(c4d.MSG_UPDATE)
+    return spline
+
+
+class PathLength(object):
+    """Maps path parameters (segment + mix) onto 0..1 shares of the polyline length.
+
+    Align to Spline places objects by length, so this is what its Position
+    needs to put an object where the tag would.
+    """
+
+    def __init__(self, path):
+        self.params = path.params
+        lengths = [0.0]
+        for p0, p1 in zip(path.points, path.points[1:]):
+            lengths.append(lengths[-1] + (p1 - p0).GetLength())
+        self.lengths = lengths
+
+    def lookup(self, param):
+        lengths = self.lengths
+        if lengths[-1] <= 0.0:
+            return 0.0
+        k = bisect_right(self.params, param)
+        if k <= 0:
+            return 0.0
+        if k >= len(lengths):
+            return 1.0
+        p0 = self.params[k-1]
+        p1 = self.params[k]
+        t = (param - p0) / (p1 - p0) if p1 > p0 else 0.0
+        return (lengths[k-1] + (lengths[k] - lengths[k-1]) * t) / lengths[-1]
+
+
+def replace_tag(doc, tag, targets, spline, path):
+    """Drives the tag's objects along spline with Align to Spline tags and disables the tag.
+
+    Returns False, without changing anything, if a channel of a driven
+    object couldn't be keyed.
+    """
+    times = bake.get_frame_times(doc)
+    easing = tags.read_easing(tag)
+    settings = [core.Settings(easing=easing, **values) for values in bake.iter_values(doc, tag, times)]
+    evaluator = core.Evaluator()
+    length = PathLength(path)
+    psr = [name for name in ("scale", "rotation") if any(getattr(s, name) for s in settings)]
+    channelText = tags.read_channels(tag)
+    channelList = channels.ChannelList()
+
+    jobs = []
+    for index, obj in enumerate(tags.get_driven_objects(tag, doc, targets)):
+        sampled = bake.sample_channels(evaluator, obj, index, targets, settings, channelList, channelText)
+        if not bake.can_key_channels(obj, sampled):
+            return False
+        jobs.append((index, obj, sampled))
+
+    for index, obj, sampled in jobs:
+        shares = []
+        for frameSettings in settings:
+            a, b, mix = evaluator.segment(targets, frameSettings, index)
+            shares.append(length.lookup(a + mix if a != b else float(a)))
+
+        if psr:
+            matrices = bake.evaluate_static(evaluator, obj, index, targets, settings)
+            bake.write_keys(doc, obj, times, matrices, [obj.GetUpMg()] * len(times), psr)
+        bake.write_channel_keys(doc, obj, times, sampled)
+
+        align = c4d.BaseTag(c4d.Taligntospline)
+        align[c4d.ALIGNTOSPLINETAG_LINK] = spline
+        align[c4d.ALIGNTOSPLINETAG_TANGENTIAL] = False
+        # Right after the Simple Moves tag on its own object, first on the others
+        obj.InsertTag(align, tag if tag.GetObject() is obj else None)
+        doc.AddUndo(c4d.UNDOTYPE_NEWOBJ, align)
+        bake.write_track(align, c4d.DescID(c4d.DescLevel(c4d.ALIGNTOSPLINETAG_POSITION, c4d.DTYPE_REAL, 0)),
+                         times, shares)
+
+    doc.AddUndo(c4d.UNDOTYPE_CHANGE_SMALL, tag)
+    tag[c4d.EXPRESSION_ENABLE] = False
+    return True
+
+
+def convert_tags(doc, splineTags, tolerance=DEFAULT_TOLERANCE, replace=False, unbaked=None):
+    """Inserts a spline of every tag's path. Returns (splines made, tags replaced).
+
+    The spline is a snapshot of the path at the current frame, so tags whose
+    targets are animated only get their spline and keep driving their
+    objects. Tags with a channel that couldn't be keyed stay enabled and are
+    appended to unbaked if given.
+    """
+    made = replaced = 0
+    for tag in splineTags:
+        targets = tags.get_targets(tag, doc)
+        if len(targets) < 2:
+            continue
+        path = build_path(core.Evaluator(), targets, tags.read_settings(tag), tolerance)
+        spline = make_spline_object(path, "%s Path" % tag.GetName())
+        doc.InsertObject(spline)
+        doc.AddUndo(c4d.UNDOTYPE_NEWOBJ, spline)
+        made += 1
+        if replace and not any(bake.is_animated(t) for t in targets):
+            if replace_tag(doc, tag, targets, spline, path):
+                replaced += 1
+            elif unbaked is not None:
+                unbaked.append(tag)
+    return made, replaced
@@ -0,0 +1,208 @@
+"""
+Samplistic Simple Moves - Tags
+Author: Delek Miller | Samplistic
+Description: Finding Simple Moves tags in a document and reading their
+settings. Works for the tag plugin and for the Python tags created by the
+simple-moves.py script, which keep the same fields in user data.
+
+Written for Maxon Cinema 4D 2025.7.3
+Python version 3.11.4
+"""
+
+
+import c4d # type: ignore
+
+import simple_moves_core as core
+
+
+PLUGIN_ID_TAG = core.PLUGIN_ID_TAG
+
+PYTHON_TAG_ID = 1022749
+
+# Settings field, plugin description ID, Python tag user data ID
+PARAMETERS = (
+    ("mode", c4d.SIMPLEMOVES_MODE, 2),
+    ("simple", c4d.SIMPLEMOVES_SIMPLE, 3),
+    ("total", c4d.SIMPLEMOVES_TOTAL, 4),
+    ("position", c4d.SIMPLEMOVES_POSITION, 7),
+    ("scale", c4d.SIMPLEMOVES_SCALE, 8),
+    ("rotation", c4d.SIMPLEMOVES_ROTATION, 9),
+    ("shortest", c4d.SIMPLEMOVES_SHORTEST, 10),
+    ("quaternion", c4d.SIMPLEMOVES_QUATERNION, None),
+    ("interpolation", c4d.SIMPLEMOVES_INTERPOLATION, 11),
+    ("softness", c4d.SIMPLEMOVES_SOFTNESS, 12),
+    ("constant_speed", c4d.SIMPLEMOVES_CONSTANT_SPEED, None),
+    ("stagger", c4d.SIMPLEMOVES_STAGGER, None),
+)
+
+TARGETS_USERDATA_ID = 5
+EASE_USERDATA_ID = 16
+EASING_USERDATA_ID = 17
+
+# Python tag user data ID -> plugin description ID
+USERDATA_MAP = dict((userDataId, paramId) for _, paramId, userDataId in PARAMETERS if userDataId is not None)
+USERDATA_MAP[TARGETS_USERDATA_ID] = c4d.SIMPLEMOVES_TARGETS
+USERDATA_MAP[EASE_USERDATA_ID] = c4d.SIMPLEMOVES_EASE
+USERDATA_MAP[EASING_USERDATA_ID] = c4d.SIMPLEMOVES_EASING
+
+
+def iter_objects(op):
+    """Walks the object hierarchy starting at op, depth first."""
+    stack = [op] if op else []
+    while stack:
+        obj = stack.pop()
+        yield obj
+        if obj.GetNext():
+            stack.append(obj.GetNext())
+        if obj.GetDown():
+            stack.append(obj.GetDown())
+
+
+def is_simple_moves_python_tag(tag):
+    if tag.GetType() != PYTHON_TAG_ID:
+        return False
+    code = tag[c4d.TPYTHON_CODE] or ""
+    return "Mix(SimpleMoves)" in code
+
+
+def is_simple_moves_tag(tag):
+    """True for the tag plugin and for Simple Moves Python tags."""
+    return tag.GetType() == PLUGIN_ID_TAG or is_simple_moves_python_tag(tag)
+
+
+def find_tags(doc, objects=None):
+    """Simple Moves tags on objects, or on every object in the document."""
+    if objects is None:
+        objects = iter_objects(doc.GetFirstObject())
+    tags = []
+    for obj in objects:
+        tags.extend(t for t in obj.GetTags() if is_simple_moves_tag(t))
+    return tags
+
+
+def selected_tags(doc):
+    """The selected Simple Moves tags, or the ones on the selected objects, or every one in the document."""
+    tags = [t for t in doc.GetActiveTags() if is_simple_moves_tag(t)]
+    if not tags:
+        objects = doc.GetActiveObjects(c4d.GETACTIVEOBJECTFLAGS_CHILDREN)
+        tags = find_tags(doc, objects if objects else None)
+    return tags
+
+
+def parameter_id(tag, field):
+    """DescID of a settings field on this kind of tag, None if it has no such field."""
+    for name, paramId, userDataId in PARAMETERS:
+        if name != field:
+            continue
+        if tag.GetType() == PLUGIN_ID_TAG:
+            return c4d.DescID(c4d.DescLevel(paramId))
+        if userDataId is None:
+            return None
+        return c4d.DescID(c4d.DescLevel(c4d.ID_USERDATA, c4d.DTYPE_SUBCONTAINER, 0),
+                          c4d.DescLevel(userDataId))
+    raise KeyError(field)
+
+
+def get_parameter(tag, descId):
+    # Older Python tags miss some of the user data fields
+    try:
+        return tag[descId]
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
+def read_values(tag):
+    """Current value of every settings field the tag has."""
+    values = {}
+    for name, _, _ in PARAMETERS:
+        descId = parameter_id(tag, name)
+        value = get_parameter(tag, descId) if descId is not None else None
+        if value is not None:
+            values[name] = value
+    return values
+
+
+def read_settings(tag):
+    if tag.GetType() == PLUGIN_ID_TAG:
+        return core.Settings(**dict((name, tag[paramId]) for name, paramId, _ in PARAMETERS))
+    return core.Settings(**read_values(tag))
+
+
+def read_easing(tag):
+    """EasingTable of the tag's Easing curve, None if Ease is off.
+
+    Samples the curve, so callers that evaluate every frame keep the
+    result until the curve is edited.
+    """
+    if tag.GetType() == PLUGIN_ID_TAG:
+        if not tag[c4d.SIMPLEMOVES_EASE]:
+            return None
+        return core.EasingTable.from_spline(tag[c4d.SIMPLEMOVES_EASING])
+    userData = c4d.DescLevel(c4d.ID_USERDATA, c4d.DTYPE_SUBCONTAINER, 0)
+    if not get_parameter(tag, c4d.DescID(userData, c4d.DescLevel(EASE_USERDATA_ID))):
+        return None
+    return core.EasingTable.from_spline(get_parameter(tag, c4d.DescID(userData, c4d.DescLevel(EASING_USERDATA_ID))))
+
+
+def read_channels(tag):
+    """Text of the Channels field, empty for Python tags, which have none."""
+    if tag.GetType() == PLUGIN_ID_TAG:
+        return tag[c4d.SIMPLEMOVES_CHANNELS] or ""
+    return ""
+
+
+def get_targets_data(tag):
+    if tag.GetType() == PLUGIN_ID_TAG:
+        return tag[c4d.SIMPLEMOVES_TARGETS]
+    return get_parameter(tag, c4d.DescID(c4d.DescLevel(c4d.ID_USERDATA, c4d.DTYPE_SUBCONTAINER, 0),
+                                         c4d.DescLevel(TARGETS_USERDATA_ID)))
+
+
+def get_targets(tag, doc):
+    """Targets of a tag: the clones of its Clones generator, else the Targets list."""
+    if tag.GetType() == PLUGIN_ID_TAG:
+        clones = core.CloneSource().get(tag[c4d.SIMPLEMOVES_CLONES], tag[c4d.SIMPLEMOVES_CLONES_SELECTION])
+        if clones is not None:
+            return clones
+    return core.resolve_targets(get_targets_data(tag), doc)
+
+
+def get_driven_objects(tag, doc, targets, listed=None):
+    """Objects the tag drives: its own object, then the Driven Objects list.
+
+    listed is the already resolved Driven Objects list, if the caller keeps
+    one. Targets and duplicates are left out so an object never drives
+    itself.
+    """
+    obj = tag.GetObject()
+    driven = [obj] if obj is not None else []
+    if tag.GetType() != PLUGIN_ID_TAG:
+        return driven
+    if listed is None:
+        listed = core.resolve_targets(tag[c4d.SIMPLEMOVES_DRIVEN], doc)
+    if not listed:
+        return driven
+    skip = set(o.GetGUID() for o in driven)
+    skip.update(o.GetGUID() for o in targets)
+    for o in listed:
+        if o.GetGUID() not in skip:
+            skip.add(o.GetGUID())
+            driven.append(o)
+    return driven
+
+
+def get_tracks(tag):
+    """Animation tracks of the tag keyed on the settings field they drive."""
+    byIds = {}
+    for track in tag.GetCTracks():
+        trackId = track.GetDescriptionID()
+        byIds[tuple(trackId[k].id for k in range(trackId.GetDepth()))] = track
+    tracks = {}
+    for name, _, _ in PARAMETERS:
+        descId = parameter_id(tag, name)
+        if descId is None:
+            continue
+        track = byIds.get(tuple(descId[k].id for k in range(descId.GetDepth())))
+        if track is not None:
+            tracks[name] = track
+    return tracks
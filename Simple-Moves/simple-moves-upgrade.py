@@ -0,0 +1,311 @@
+"""
+Samplistic Simple Moves - Upgrade
+Author: Delek Miller | Samplistic
+Description: Upgrades the Python tags made by older Simple Moves scripts in
+place. A tag's release is recognised by a fingerprint of its code; known
+releases get the code of simple-moves.py next to this script and the user
+data fields they are missing (Interpolation, Softness), with their defaults.
+The values of the fields the tag already has are left as they are. Tags
+whose code matches no known release, e.g. because it was edited by hand,
+are reported with their fingerprint and left alone.
+
+Usage:
+    Script Manager: upgrades the tags in the active document, one undo step.
+
+    Command line, with Cinema 4D's c4dpy:
+        c4dpy simple-moves-upgrade.py scenes/             every .c4d file below scenes/
+        c4dpy simple-moves-upgrade.py a.c4d b.c4d --dry-run
+        c4dpy simple-moves-upgrade.py scenes/ --jobs 8 --report report.json
+
+    Files are split over --jobs worker processes, each a c4dpy of its own
+    that loads, upgrades and saves its files one at a time and reports
+    every file as soon as it is done. Files without a tag to upgrade are not
+    saved again.
+
+Written for Maxon Cinema 4D 2025.7.3
+Python version 3.11.4
+"""
+
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import c4d # type: ignore
+
+
+SCRIPT_PATH = os.path.abspath(__file__)
+CURRENT_SCRIPT_PATH = os.path.join(os.path.dirname(SCRIPT_PATH), "simple-moves.py")
+
+PYTHON_TAG_ID = 1022749
+
+# In the code of every Simple Moves release
+MARKER = "Mix(SimpleMoves)"
+
+# Code fingerprint -> release that made the tag. Add the fingerprint the
+# report prints for tags of a release that is missing here.
+FINGERPRINTS = {
+    "d68edad00d519b4f": "1.0.1", # Script header says 1.0.0
+    "4ed51618719be0f8": "1.0.3",
+    "3ee297678fe32f3e": "1.0.5",
+    "11b04ccab638bd73": "1.0.6",
+    "3e789116fdc9f169": "1.0.7",
+    "3e4b0746acda9108": "1.0.8",
+    "ac3796964069cced": "1.0.10", # Same code as 1.0.9
+    "a4f70298b683e001": "1.0.11",
+}
+
+# User data IDs of Mode, Total, Interpolation and Softness
+MODE_ID, TOTAL_ID, INTERPOLATION_ID, SOFTNESS_ID = 2, 4, 11, 12
+
+_current = None
+
+
+def Fingerprint(code):
+    """Short hash of tag code, blind to line endings and trailing whitespace."""
+    lines = [line.rstrip() for line in code.replace("\r\n", "\n").replace("\r", "\n").split("\n")]
+    return hashlib.sha1("\n".join(lines).strip("\n").encode("utf-8")).hexdigest()[:16]
+
+
+def LoadCurrent():
+    """simple-moves.py as a module and a tag built by it, loaded once."""
+    global _current
+    if _current is None:
+        spec = importlib.util.spec_from_file_location("simple_moves_script", CURRENT_SCRIPT_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        prototype = module.BuildPythonTag()
+        _current = (module, prototype, Fingerprint(prototype[c4d.TPYTHON_CODE]))
+    return _current
+
+
+def UserDataId(descId):
+    return descId[1].id
+
+
+def AddMissingUserData(tag, prototype):
+    """Adds the prototype's user data fields the tag lacks, with their defaults.
+
+    Returns False if the new fields can't get the IDs the tag code reads
+    them from, e.g. because user data was added to the tag by hand. That
+    is checked before anything is added.
+    """
+    have = set(UserDataId(descId) for descId, _ in tag.GetUserDataContainer())
+    missing = [(descId, bc) for descId, bc in prototype.GetUserDataContainer()
+               if UserDataId(descId) not in have]
+    if not missing:
+        return True
+    # AddUserData() hands out the next free ID, so the new fields only land
+    # on the right IDs if nothing sits above them
+    if have and max(have) > min(UserDataId(descId) for descId, _ in missing):
+        return False
+    for descId, bc in missing:
+        element = tag.AddUserData(bc)
+        if element is None or UserDataId(element) != UserDataId(descId):
+            return False
+        if descId[1].dtype != c4d.DTYPE_GROUP:
+            tag[element] = prototype[descId]
+    return True
+
+
+def Identify(tag):
+    """(release, fingerprint) of a Python tag's code.
+
+    release is "current" for tags made by simple-moves.py as it is now and
+    None for code no release had. Tags that aren't Simple Moves tags give
+    (None, None).
+    """
+    code = tag[c4d.TPYTHON_CODE] or ""
+    if MARKER not in code:
+        return None, None
+    fingerprint = Fingerprint(code)
+    if fingerprint == LoadCurrent()[2]:
+        return "current", fingerprint
+    return FINGERPRINTS.get(fingerprint), fingerprint
+
+
+def UpgradeTag(doc, tag, undo=False):
+    """Swaps in the current code and adds the missing fields. Returns the new status."""
+    module, prototype, _ = LoadCurrent()
+    if undo:
+        doc.AddUndo(c4d.UNDOTYPE_CHANGE, tag)
+    if not AddMissingUserData(tag, prototype):
+        return "user data differs"
+    tag[c4d.TPYTHON_CODE] = prototype[c4d.TPYTHON_CODE]
+    # From 1.0.7 the tag only updates these when Mode or Interpolation change
+    module.HideUserData(tag, c4d.DescID(c4d.DescLevel(c4d.ID_USERDATA, c4d.DTYPE_SUBCONTAINER, 0),
+                                        c4d.DescLevel(TOTAL_ID)), tag[c4d.ID_USERDATA, MODE_ID] == 0)
+    module.HideUserData(tag, c4d.DescID(c4d.DescLevel(c4d.ID_USERDATA, c4d.DTYPE_SUBCONTAINER, 0),
+                                        c4d.DescLevel(SOFTNESS_ID)), tag[c4d.ID_USERDATA, INTERPOLATION_ID] == 0)
+    return "upgraded"
+
+
+def UpgradeDocument(doc, dryRun=False, undo=False):
+    """Upgrades every Simple Moves Python tag in doc. Returns one report entry per tag."""
+    module = LoadCurrent()[0]
+    entries = []
+    for obj in module.IterObjects(doc.GetFirstObject()):
+        for tag in obj.GetTags():
+            if tag.GetType() != PYTHON_TAG_ID:
+                continue
+            release, fingerprint = Identify(tag)
+            if fingerprint is None:
+                continue
+            if release == "current":
+                status = "current"
+            elif release is None:
+                status = "unknown"
+            elif dryRun:
+                status = "would upgrade"
+            else:
+                status = UpgradeTag(doc, tag, undo)
+            entries.append({"object": obj.GetName(), "tag": tag.GetName(), "release": release,
+                            "status": status, "fingerprint": fingerprint})
+    return entries
+
+
+def UpgradeFile(path, dryRun=False, backup=False):
+    """Loads, upgrades and saves one scene file. Returns its report."""
+    report = {"file": path, "tags": [], "error": None}
+    doc = c4d.documents.LoadDocument(path, c4d.SCENEFILTER_OBJECTS | c4d.SCENEFILTER_MATERIALS)
+    if doc is None:
+        report["error"] = "could not load"
+        return report
+    try:
+        report["tags"] = UpgradeDocument(doc, dryRun)
+        if not dryRun and any(entry["status"] == "upgraded" for entry in report["tags"]):
+            if backup:
+                shutil.copy2(path, path + ".bak")
+            if not c4d.documents.SaveDocument(doc, path, c4d.SAVEDOCUMENTFLAGS_NONE, c4d.FORMAT_C4DEXPORT):
+                report["error"] = "could not save"
+    finally:
+        c4d.documents.KillDocument(doc)
+    return report
+
+
+def FindSceneFiles(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in sorted(names) if name.lower().endswith(".c4d"))
+        else:
+            files.append(path)
+    return files
+
+
+def RunWorker(files, dryRun, backup):
+    # One JSON line per file on stdout, read by RunWorkers()
+    for path in files:
+        try:
+            report = UpgradeFile(path, dryRun, backup)
+        except Exception as error:
+            report = {"file": path, "tags": [], "error": "%s: %s" % (type(error).__name__, error)}
+        sys.stdout.write(json.dumps(report) + "\n")
+        sys.stdout.flush()
+
+
+def RunWorkers(files, jobs, dryRun, backup, onReport):
+    """Upgrades files in jobs c4dpy worker processes, calling onReport for every file."""
+    chunks = [files[k::jobs] for k in range(jobs) if files[k::jobs]]
+    lock = threading.Lock()
+
+    def runChunk(chunk):
+        command = [sys.executable, SCRIPT_PATH, "--worker"] + chunk
+        if dryRun:
+            command.append("--dry-run")
+        if backup:
+            command.append("--backup")
+        done = set()
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        for line in process.stdout:
+            # c4dpy prints its own start-up lines as well
+            if not line.startswith("{"):
+                continue
+            report = json.loads(line)
+            done.add(report["file"])
+            with lock:
+                onReport(report)
+        code = process.wait()
+        for path in chunk:
+            if path not in done:
+                with lock:
+                    onReport({"file": path, "tags": [], "error": "worker exited with code %d" % code})
+
+    with ThreadPoolExecutor(len(chunks) or 1) as pool:
+        list(pool.map(runChunk, chunks))
+
+
+def FormatReport(report):
+    counts = {}
+    for entry in report["tags"]:
+        counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+    text = ", ".join("%d %s" % (count, status) for status, count in sorted(counts.items())) or "no Simple Moves tags"
+    if report["error"]:
+        text = "ERROR %s (%s)" % (report["error"], text)
+    lines = ["%s: %s" % (report["file"], text)]
+    for entry in report["tags"]:
+        if entry["status"] in ("unknown", "user data differs"):
+            lines.append("    %s / %s: %s, fingerprint %s" % (entry["object"], entry["tag"],
+                                                             entry["status"], entry["fingerprint"]))
+    return "\n".join(lines)
+
+
+def RunCommandLine(argv=None):
+    parser = argparse.ArgumentParser(description="Upgrade Simple Moves Python tags in .c4d files")
+    parser.add_argument("paths", nargs="+", help=".c4d files or folders to search for them")
+    parser.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="worker processes, each runs its own c4dpy")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would be upgraded")
+    parser.add_argument("--backup", action="store_true", help="keep the original of every saved file as .c4d.bak")
+    parser.add_argument("--report", default=None, help="also write the per-file report to this JSON file")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        RunWorker(args.paths, args.dry_run, args.backup)
+        return 0
+
+    files = FindSceneFiles(args.paths)
+    reports = []
+
+    def onReport(report):
+        reports.append(report)
+        print(FormatReport(report))
+        sys.stdout.flush()
+
+    RunWorkers(files, max(1, args.jobs), args.dry_run, args.backup, onReport)
+    upgraded = sum(1 for r in reports for entry in r["tags"] if entry["status"] in ("upgraded", "would upgrade"))
+    failed = sum(1 for r in reports if r["error"])
+    print("%d file(s), %d tag(s) %s, %d error(s)" % (len(reports), upgraded,
+                                                    "to upgrade" if args.dry_run else "upgraded", failed))
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(sorted(reports, key=lambda r: r["file"]), f, indent=2)
+    return 1 if failed else 0
+
+
+def main():
+    doc.StartUndo()
+    entries = UpgradeDocument(doc, undo=True)
+    doc.EndUndo()
+    c4d.EventAdd()
+    report = {"file": doc.GetDocumentName(), "tags": entries, "error": None}
+    print(FormatReport(report))
+    upgraded = sum(1 for entry in entries if entry["status"] == "upgraded")
+    c4d.gui.MessageDialog("Upgraded %d of %d Simple Moves tag(s), see the console for details." % (upgraded, len(entries)))
+
+# Execute script
+if __name__ == '__main__':
+    # The Script Manager provides doc, c4dpy doesn't
+    if "doc" in globals():
+        main()
+    else:
+        sys.exit(RunCommandLine())
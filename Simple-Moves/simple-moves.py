@@ -2,9 +2,50 @@
 Samplistic Simple Moves
 Author: Delek Miller | Samplistic
 Original Concept: Michael Rosen | Samplistic
-Version: 1.0.6
+Version: 1.0.12
 Description: Interpolate PSR between objects in space
 
+Changes in 1.0.12:
+- Ease + Easing: a curve remaps the mix within every segment, so moves
+  can ease in and out of each target without keys on the sliders. The
+  curve is sampled into a lookup table when it is edited, and every frame
+  only reads the table.
+
+Changes in 1.0.11:
+- Errors in the tag are no longer logged on every evaluation. The first
+  error of a kind (type and line) is logged with its traceback, repeats
+  only as one "repeated N times" line every few seconds. The new Errors
+  group shows the Error Count and the Last Error on the tag.
+- After an error the tag leaves its object alone and does no work until
+  its settings, its Targets or the scene hierarchy change, so playback
+  stays at full speed.
+
+Changes in 1.0.10:
+- With several objects selected, every one of them gets a Simple Moves
+  tag in one go: the tag and its user data are built once and cloned onto
+  each object, with a single undo step.
+- Shift-click asks for a naming pattern to fill each tag's Targets list,
+  e.g. "{name}_target*" gives the tag on "Cube" the objects "Cube_target1",
+  "Cube_target2", ... in name order. * and ? are wildcards.
+
+Changes in 1.0.9:
+- The tag resolves its Targets in its own document (op.GetDocument())
+  instead of the module-level doc, and the cached list remembers which
+  document it belongs to, so a document clone being rendered never picks
+  up the editor document's objects.
+
+Changes in 1.0.8:
+- The Targets list is resolved once and cached on the tag. It is only
+  walked again when the list is edited, objects are added to or removed
+  from the scene, or after an undo/redo. Entries of deleted objects are
+  removed from the list at that point instead of on every evaluation.
+
+Changes in 1.0.7:
+- Showing/hiding the Simple Moves, Total and Softness fields now happens in
+  the tag's message() when Mode or Interpolation are edited, instead of
+  rewriting the user data description on every evaluation. Playback does
+  no description writes at all.
+
 Changes in 1.0.6:
 - Softness slider now behaves intuitively:
     0% = pure linear (sharp corners at each target)
@@ -23,9 +64,15 @@ Python version 3.11.4
 """
 
 
+import re
+
 import c4d # type: ignore
 
 
+# User data ID of the Targets list
+TARGETS_ID = 5
+
+
 def CreateUserDataGroup(obj, name, columns=1, parentGroup=None):
     if obj is None: return False
     group = c4d.GetCustomDatatypeDefault(c4d.DTYPE_GROUP)
@@ -108,26 +155,87 @@ def CreateUserDataPercentSlider(obj, name, val=0, min=0, max=1, parentGroup=None
     obj[element] = val
     return element
 
+def CreateUserDataLong(obj, name, val=0, parentGroup=None):
+    if obj is None: return False
+    bc = c4d.GetCustomDatatypeDefault(c4d.DTYPE_LONG)
+    bc[c4d.DESC_NAME] = name
+    bc[c4d.DESC_SHORT_NAME] = name
+    bc[c4d.DESC_DEFAULT] = val
+    bc[c4d.DESC_ANIMATE] = c4d.DESC_ANIMATE_OFF
+    bc[c4d.DESC_MIN] = 0
+    if parentGroup is not None:
+        bc[c4d.DESC_PARENTGROUP] = parentGroup
+    element = obj.AddUserData(bc)
+    if element:
+        obj[element] = val
+    return element
+
+
+def CreateUserDataText(obj, name, parentGroup=None):
+    if obj is None: return False
+    bc = c4d.GetCustomDatatypeDefault(c4d.DTYPE_STRING)
+    bc[c4d.DESC_NAME] = name
+    bc[c4d.DESC_SHORT_NAME] = name
+    bc[c4d.DESC_ANIMATE] = c4d.DESC_ANIMATE_OFF
+    if parentGroup is not None:
+        bc[c4d.DESC_PARENTGROUP] = parentGroup
+    element = obj.AddUserData(bc)
+    if element:
+        obj[element] = ""
+    return element
+
+
+def EaseInOutSpline():
+    spline = c4d.SplineData()
+    spline.SetRange(0.0, 1.0, 0.01, 0.0, 1.0, 0.01)
+    spline.InsertKnot(0.0, 0.0)
+    spline.InsertKnot(1.0, 1.0)
+    # Flat tangents at both ends
+    spline.SetKnot(0, c4d.Vector(0.0, 0.0, 0.0), 0, False, c4d.Vector(0.0), c4d.Vector(0.33, 0.0, 0.0))
+    spline.SetKnot(1, c4d.Vector(1.0, 1.0, 0.0), 0, False, c4d.Vector(-0.33, 0.0, 0.0), c4d.Vector(0.0))
+    return spline
+
+
+def CreateUserDataSpline(obj, name, parentGroup=None):
+    if obj is None: return False
+    bc = c4d.GetCustomDatatypeDefault(c4d.CUSTOMDATATYPE_SPLINE)
+    bc[c4d.DESC_NAME] = name
+    bc[c4d.DESC_SHORT_NAME] = name
+    bc[c4d.DESC_ANIMATE] = c4d.DESC_ANIMATE_OFF
+    bc[c4d.DESC_CUSTOMGUI] = c4d.CUSTOMGUI_SPLINE
+    if parentGroup is not None:
+        bc[c4d.DESC_PARENTGROUP] = parentGroup
+    element = obj.AddUserData(bc)
+    if element:
+        obj[element] = EaseInOutSpline()
+    return element
+
+
+def HideUserData(obj, element, hide=True):
+    for descId, bc in obj.GetUserDataContainer():
+        if descId == element:
+            bc[c4d.DESC_HIDE] = hide
+            obj.SetUserDataContainer(descId, bc)
+
+
 def getIconPath():
     scriptPath = __file__
     iconPath = scriptPath.rsplit('.', 1)[0] + ".tif"
     return iconPath
 
-def CreatePythonTag(obj):
+def BuildPythonTag():
+    """Creates the Simple Moves Python tag with its user data and code, not inserted anywhere."""
     pyTag = c4d.BaseTag(1022749)
     pyTag.SetName("Simple Moves")
     
     # Get icon
     pyTag[c4d.ID_BASELIST_ICON_FILE] = getIconPath()
     
-    obj.InsertTag(pyTag)
-    doc.AddUndo(c4d.UNDOTYPE_NEWOBJ, pyTag) # type: ignore
-    
     # General Settings
     groupIDSettings = CreateUserDataGroup(pyTag, "Settings")
     CreateUserDataCycle(pyTag, "Mode", "Simple Moves, Total", groupIDSettings)
     CreateUserDataPercentSlider(pyTag, "Simple Moves", 0, 0, 2147483647, groupIDSettings)
-    CreateUserDataPercentSlider(pyTag, "Total", 0, 0, 1, groupIDSettings)
+    totalID = CreateUserDataPercentSlider(pyTag, "Total", 0, 0, 1, groupIDSettings)
     CreateObjectList(pyTag, "Targets", groupIDSettings)
     
     # Transform Settings
@@ -140,8 +248,24 @@ def CreatePythonTag(obj):
     # Softness Settings
     CreateUserDataCycle(pyTag, "Interpolation", "Linear, Soft", groupIDSettings)
     # Softness: 0 = linear feel, 1 = fully smooth centripetal spline
-    CreateUserDataPercentSlider(pyTag, "Softness", 0.5, 0, 1, groupIDSettings)
-    
+    softnessID = CreateUserDataPercentSlider(pyTag, "Softness", 0.5, 0, 1, groupIDSettings)
+
+    # Initial visibility for Mode "Simple Moves" and Interpolation "Linear",
+    # the tag only updates it when those fields change
+    HideUserData(pyTag, totalID)
+    HideUserData(pyTag, softnessID)
+
+    # Errors, only shown once the tag had one. Setting Error Count to 0
+    # hides the group again.
+    groupIDErrors = CreateUserDataGroup(pyTag, "Errors")
+    CreateUserDataLong(pyTag, "Error Count", 0, groupIDErrors)
+    CreateUserDataText(pyTag, "Last Error", groupIDErrors)
+    HideUserData(pyTag, groupIDErrors)
+
+    # Easing within each segment, the curve maps mix in (x) to mix out (y)
+    CreateUserDataCheckbox(pyTag, "Ease", 0, groupIDSettings)
+    easingID = CreateUserDataSpline(pyTag, "Easing", groupIDSettings)
+    HideUserData(pyTag, easingID)
 
     # Python tag code
     # ---------------------------------------------------------------------
@@ -150,33 +274,122 @@ def CreatePythonTag(obj):
         "from c4d import utils as u\n"
         "import math\n"
         "import logging\n"
+        "import time\n"
         "from logging import traceback\n"
         "\n"
         "\n"
+        "# Resolved Targets list as (document, key, objects), see clean_inexclude_userdata()\n"
+        "targets_cache = None\n"
+        "# Bumped when the Targets list is edited or an undo/redo happens\n"
+        "targets_version = 0\n"
+        "# Errors by signature as [count, count when last logged, time last logged]\n"
+        "error_log = {}\n"
+        "# Errors not yet added to the Errors field\n"
+        "error_pending = 0\n"
+        "# inputs_key() while the tag passes through after an error\n"
+        "error_hold = None\n"
+        "# Seconds between two console lines about the same repeating error\n"
+        "ERROR_INTERVAL = 5.0\n"
+        "# Easing curve sampled at EASING_SIZE mix values, see ease()\n"
+        "easing_lut = None\n"
+        "EASING_SIZE = 128\n"
+        "\n"
+        "\n"
         "# Functions\n"
         "def setMoveMode():\n"
-        "    udc = op.GetUserDataContainer()\n"
-        "    for descId, bc in udc:\n"
-        "        if descId[1].id == 3:\n"
-        "            if op[c4d.ID_USERDATA,2] == 0:\n"
-        "                bc[c4d.DESC_HIDE] = False\n"
-        "                op.SetUserDataContainer(descId, bc)\n"
-        "            else:\n"
-        "                bc[c4d.DESC_HIDE] = True\n"
-        "                op.SetUserDataContainer(descId, bc)\n"
-        "        if descId[1].id == 4:\n"
-        "            if op[c4d.ID_USERDATA,2] == 1:\n"
-        "                bc[c4d.DESC_HIDE] = False\n"
-        "                op.SetUserDataContainer(descId, bc)\n"
-        "            else:\n"
-        "                bc[c4d.DESC_HIDE] = True\n"
-        "                op.SetUserDataContainer(descId, bc)\n"
-        "        if descId[1].id == 12:\n"
-        "           if op[c4d.ID_USERDATA, 11] == 1:\n"
-        "               bc[c4d.DESC_HIDE] = False\n"
-        "           else:\n"
-        "               bc[c4d.DESC_HIDE] = True\n"
-        "           op.SetUserDataContainer(descId, bc)\n"
+        "    mode = op[c4d.ID_USERDATA,2]\n"
+        "    interp = op[c4d.ID_USERDATA,11]\n"
+        "    # User data ID -> hidden\n"
+        "    hidden = {3: mode != 0, 4: mode != 1, 12: interp != 1, 17: not op[c4d.ID_USERDATA,16]}\n"
+        "    for descId, bc in op.GetUserDataContainer():\n"
+        "        hide = hidden.get(descId[1].id)\n"
+        "        if hide is None or bool(bc[c4d.DESC_HIDE]) == hide:\n"
+        "            continue # Only write what actually changes\n"
+        "        bc[c4d.DESC_HIDE] = hide\n"
+        "        op.SetUserDataContainer(descId, bc)\n"
+        "\n"
+        "\n"
+        "def set_errors_visible(show):\n"
+        "    for descId, bc in op.GetUserDataContainer():\n"
+        "        if descId[1].id == 13 and bool(bc[c4d.DESC_HIDE]) == show:\n"
+        "            bc[c4d.DESC_HIDE] = not show\n"
+        "            op.SetUserDataContainer(descId, bc)\n"
+        "\n"
+        "\n"
+        "def message(msg_type, data):\n"
+        "    global targets_version, easing_lut\n"
+        "    if msg_type == c4d.MSG_DOCUMENTINFO and isinstance(data, dict):\n"
+        "        # Undo/redo can put back a different Targets list or curve\n"
+        "        if data.get('type') in (c4d.MSG_DOCUMENTINFO_TYPE_UNDO, c4d.MSG_DOCUMENTINFO_TYPE_REDO):\n"
+        "            targets_version += 1\n"
+        "            easing_lut = None\n"
+        "        return\n"
+        "    # Mode and Interpolation are not animatable, so the fields only\n"
+        "    # need to be shown/hidden when someone edits them\n"
+        "    if msg_type != c4d.MSG_DESCRIPTION_POSTSETPARAMETER:\n"
+        "        return\n"
+        "    descId = data['descid']\n"
+        "    if descId[0].id != c4d.ID_USERDATA or descId.GetDepth() < 2:\n"
+        "        return\n"
+        "    if descId[1].id in (2, 11, 16):\n"
+        "        setMoveMode()\n"
+        "    elif descId[1].id == 17:\n"
+        "        easing_lut = None # Sampled again on the next evaluation\n"
+        "    elif descId[1].id == 5:\n"
+        "        targets_version += 1\n"
+        "    elif descId[1].id == 14 and not op[c4d.ID_USERDATA,14]:\n"
+        "        # Errors set to 0: start over, the next error is logged in full\n"
+        "        error_log.clear()\n"
+        "        set_errors_visible(False)\n"
+        "\n"
+        "\n"
+        "def inputs_key():\n"
+        "    # Settings, objects added/removed in the scene, edits and undos\n"
+        "    doc = op.GetDocument()\n"
+        "    hierarchy = doc.GetHDirty(c4d.HDIRTYFLAGS_OBJECT_HIERARCHY) if doc is not None else 0\n"
+        "    return (op.GetDirty(c4d.DIRTYFLAGS_DATA), hierarchy, targets_version)\n"
+        "\n"
+        "\n"
+        "def error_signature(error):\n"
+        "    # Type and line it was raised on, the message may differ every frame\n"
+        "    tb = error.__traceback__\n"
+        "    while tb is not None and tb.tb_next is not None:\n"
+        "        tb = tb.tb_next\n"
+        "    return (type(error).__name__, tb.tb_lineno if tb is not None else 0)\n"
+        "\n"
+        "\n"
+        "def show_error(error):\n"
+        "    global error_pending\n"
+        "    try:\n"
+        "        op[c4d.ID_USERDATA,14] = (op[c4d.ID_USERDATA,14] or 0) + error_pending # User Data: Errors\n"
+        "        op[c4d.ID_USERDATA,15] = '{}: {}'.format(type(error).__name__, error) # User Data: Last Error\n"
+        "        set_errors_visible(True)\n"
+        "    except (AttributeError, KeyError, TypeError):\n"
+        "        pass # Tag without the error fields\n"
+        "    error_pending = 0\n"
+        "\n"
+        "\n"
+        "def report_error(error):\n"
+        "    # The first error of a kind is logged with its traceback, repeats\n"
+        "    # only as a count, at most every ERROR_INTERVAL seconds. Then the\n"
+        "    # tag passes through until its inputs change.\n"
+        "    global error_pending, error_hold\n"
+        "    error_pending += 1\n"
+        "    signature = error_signature(error)\n"
+        "    now = time.monotonic()\n"
+        "    entry = error_log.get(signature)\n"
+        "    if entry is None:\n"
+        "        error_log[signature] = [1, 1, now]\n"
+        "        logging.error(traceback.format_exc())\n"
+        "        show_error(error)\n"
+        "    else:\n"
+        "        entry[0] += 1\n"
+        "        if now - entry[2] >= ERROR_INTERVAL:\n"
+        "            logging.error('Simple Moves: {} on line {} repeated {} times'.format(signature[0], signature[1], entry[0] - entry[1]))\n"
+        "            entry[1] = entry[0]\n"
+        "            entry[2] = now\n"
+        "            show_error(error)\n"
+        "    error_hold = inputs_key()\n"
         "\n"
         "\n"
         "def SetGlobalPosition(obj, mat1, mat2, factor):\n"
@@ -236,30 +449,73 @@ def CreatePythonTag(obj):
         "    target.SetRelRot(c4d.Vector(mixH, mixP, mixB)) # Set rotation on target object\n"
         "\n"
         "\n"
+        "def targets_key(doc, data):\n"
+        "    # Entry count, objects added/removed in the scene, edits and undos\n"
+        "    return (data.GetObjectCount(), doc.GetHDirty(c4d.HDIRTYFLAGS_OBJECT_HIERARCHY), targets_version)\n"
+        "\n"
+        "\n"
         "def clean_inexclude_userdata(op, userdata_id):\n"
+        "    global targets_cache\n"
         "    data = op[userdata_id]\n"
         "    if not isinstance(data, c4d.InExcludeData):\n"
         "        raise TypeError('User data at ID {} is not an InExcludeData'.format(userdata_id))\n"
-        "\n"
+        "    doc = op.GetDocument() # The tag's own document, not the module-level one\n"
+        "    if doc is None:\n"
+        "        return []\n"
+        "    if targets_cache is not None:\n"
+        "        cachedDoc, key, objects = targets_cache\n"
+        "        if cachedDoc.IsAlive() and cachedDoc == doc and key == targets_key(doc, data):\n"
+        "            return objects\n"
+        "\n"
+        "    # One pass collects the objects and the entries that no longer resolve\n"
         "    valid_objects = []\n"
+        "    missing = []\n"
         "    for i in range(data.GetObjectCount()):\n"
         "        obj = data.ObjectFromIndex(doc, i)\n"
         "        if obj is not None:\n"
-        "            flags = data.GetFlags(i)\n"
         "            valid_objects.append(obj)\n"
-        "\n"
-        "    missing = []\n"
-        "    for i in range(data.GetObjectCount()):\n"
-        "        if data.ObjectFromIndex(doc, i) is None:\n"
+        "        else:\n"
         "            missing.append(i)\n"
-        "    if not missing:\n"
-        "        return valid_objects\n"
-        "    for i in reversed(missing):\n"
-        "        data.DeleteObject(i)\n"
+        "    if missing:\n"
+        "        for i in reversed(missing):\n"
+        "            data.DeleteObject(i)\n"
+        "        op[userdata_id] = data # Store the cleaned list, once\n"
         "\n"
+        "    targets_cache = (doc, targets_key(doc, data), valid_objects)\n"
         "    return valid_objects\n"
         "\n"
         "\n"
+        "def sample_easing(spline):\n"
+        "    # The curve parameter is not x, so sample densely and resample by x\n"
+        "    count = EASING_SIZE * 4\n"
+        "    points = sorted((p.x, p.y) for p in (spline.GetPoint(float(k) / (count - 1)) for k in range(count)))\n"
+        "    lut = []\n"
+        "    j = 1\n"
+        "    for k in range(EASING_SIZE):\n"
+        "        x = float(k) / (EASING_SIZE - 1)\n"
+        "        while j < len(points) - 1 and points[j][0] < x:\n"
+        "            j += 1\n"
+        "        (x0, y0), (x1, y1) = points[j-1], points[j]\n"
+        "        f = (x - x0) / (x1 - x0) if x1 - x0 > 0.0 else 0.0\n"
+        "        lut.append(y0 + (y1 - y0) * min(max(f, 0.0), 1.0))\n"
+        "    return lut\n"
+        "\n"
+        "\n"
+        "def ease(mix):\n"
+        "    # Table lookup, the curve is only sampled after it was edited\n"
+        "    global easing_lut\n"
+        "    if easing_lut is None:\n"
+        "        spline = op[c4d.ID_USERDATA,17] # User Data: Easing\n"
+        "        if spline is None or spline.GetKnotCount() < 2:\n"
+        "            return mix\n"
+        "        easing_lut = sample_easing(spline)\n"
+        "    x = mix * (EASING_SIZE - 1)\n"
+        "    k = int(x)\n"
+        "    if k >= EASING_SIZE - 1:\n"
+        "        return easing_lut[-1]\n"
+        "    return easing_lut[k] + (easing_lut[k+1] - easing_lut[k]) * (x - k)\n"
+        "\n"
+        "\n"
         "def catmull_pos_centripetal(p0, p1, p2, p3, t):\n"
         "    # Centripetal Catmull-Rom (alpha=0.5, Barry-Goldman form).\n"
         "    # Gives near-constant visual speed through unevenly spaced\n"
@@ -291,6 +547,11 @@ def CreatePythonTag(obj):
         "\n"
         "\n"
         "def main():\n"
+        "    global error_hold\n"
+        "    if error_hold is not None:\n"
+        "        if error_hold == inputs_key():\n"
+        "            return # Pass through until something changes\n"
+        "        error_hold = None\n"
         "    try:\n"
         "        # Read in user data\n"
         "        mode = op[c4d.ID_USERDATA,2] # User Data: Mode\n"
@@ -311,8 +572,6 @@ def CreatePythonTag(obj):
         "        if softness < 0.0: softness = 0.0\n"
         "        if softness > 1.0: softness = 1.0\n"
         "\n"
-        "        # Set mode to Simple Moves or Total\n"
-        "        setMoveMode()\n"
         "        # Driver code\n"
         "        obj = op.GetObject() # Get object\n"
         "        array = objects # Initialize a list for targets\n"
@@ -336,6 +595,8 @@ def CreatePythonTag(obj):
         "                obj1_ = array[-1] # Get object for basic rotation\n"
         "                obj2_ = array[-1]\n"
         "            mix = data % 1 # Calculate mix value\n"
+        "            if i < cnt-1 and op[c4d.ID_USERDATA,16]: # User Data: Ease\n"
+        "                mix = ease(mix)\n"
         "\n"
         "            if pos == True:\n"
         "                if interp == 0:\n"
@@ -376,17 +637,142 @@ def CreatePythonTag(obj):
         "                    SetGlobalRotation(obj, mat_a, mat_b, mix) # Set rotation\n"
         "                else:\n"
         "                    SetBasicRotation(obj, obj1_, obj2_, mix)\n"
-        "    except Exception:\n"
-        "        logging.error(traceback.format_exc())\n"
+        "    except Exception as error:\n"
+        "        report_error(error)\n"
         "\n"
     )
     # Python tag code end
     # ---------------------------------------------------------------------
     pyTag[c4d.ID_USERDATA,2] == 0
+    return pyTag
+
+
+def CreatePythonTag(obj):
+    pyTag = BuildPythonTag()
+    obj.InsertTag(pyTag)
+    doc.AddUndo(c4d.UNDOTYPE_NEWOBJ, pyTag) # type: ignore
     return True
 
 
+def IterObjects(op):
+    """Walks the object hierarchy starting at op, depth first."""
+    stack = [op] if op else []
+    while stack:
+        obj = stack.pop()
+        yield obj
+        if obj.GetNext():
+            stack.append(obj.GetNext())
+        if obj.GetDown():
+            stack.append(obj.GetDown())
+
+
+def NaturalKey(name):
+    # "target2" sorts before "target10"
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r"(\d+)", name)]
+
+
+def PatternRegex(pattern, name=None):
+    """Compiled pattern, with name filled in literally for {name}."""
+    regex = ""
+    for part in re.split(r"(\{name\}|\*|\?)", pattern):
+        if part == "{name}":
+            regex += re.escape(name or "")
+        elif part == "*":
+            regex += ".*"
+        elif part == "?":
+            regex += "."
+        else:
+            regex += re.escape(part)
+    return re.compile(regex + "$")
+
+
+def FindPatternTargets(pattern, names):
+    """Objects whose name matches pattern, grouped by the name put in for {name}.
+
+    One pass over the document however many objects get tags: an object
+    only looks up the parts of its own name left over by the text before
+    {name} in the set of names. It goes to the longest name it matches, so
+    with "Cube" and "Cube_a" selected "Cube_a_1" belongs to "Cube_a" only.
+    Without {name} in the pattern every match lands in the None group.
+    """
+    groups = {}
+    head, hasName, tail = pattern.partition("{name}")
+    if not hasName:
+        regex = PatternRegex(pattern)
+        groups[None] = [obj for obj in IterObjects(doc.GetFirstObject()) if regex.match(obj.GetName())]
+    else:
+        names = set(names)
+        headRegex = PatternRegex(head)
+        tails = {}
+        for obj in IterObjects(doc.GetFirstObject()):
+            objName = obj.GetName()
+            best = None
+            for start in range(len(objName) + 1):
+                if not headRegex.match(objName[:start]):
+                    continue
+                # Longest first, and only names longer than the best so far
+                for end in range(len(objName), start + (len(best) if best else 0), -1):
+                    name = objName[start:end]
+                    if name not in names:
+                        continue
+                    # The text after the first {name} may hold it again
+                    regex = tails.get(name)
+                    if regex is None:
+                        regex = tails[name] = PatternRegex(tail, name)
+                    if regex.match(objName[end:]):
+                        best = name
+                        break
+            if best is not None:
+                groups.setdefault(best, []).append(obj)
+    for objects in groups.values():
+        objects.sort(key=lambda o: NaturalKey(o.GetName()))
+    return groups
+
+
+def ApplyToObjects(objects, pattern=None):
+    """Puts a Simple Moves tag on every object, cloned from one prototype.
+
+    pattern fills each tag's Targets, see FindPatternTargets(). Needs an
+    open undo group. Returns the number of tags created.
+    """
+    prototype = BuildPythonTag()
+    groups = FindPatternTargets(pattern, [obj.GetName() for obj in objects]) if pattern else None
+    # A selected object gets its own tag, it's never another one's target
+    selected = set(obj.GetGUID() for obj in objects)
+    for obj in objects:
+        pyTag = prototype.GetClone(c4d.COPYFLAGS_NONE)
+        obj.InsertTag(pyTag)
+        doc.AddUndo(c4d.UNDOTYPE_NEWOBJ, pyTag) # type: ignore
+        if groups is None:
+            continue
+        key = obj.GetName() if "{name}" in pattern else None
+        targets = [t for t in groups.get(key, []) if t.GetGUID() not in selected]
+        if targets:
+            data = c4d.InExcludeData()
+            for target in targets:
+                data.InsertObject(target, 0)
+            pyTag[c4d.ID_USERDATA, TARGETS_ID] = data
+    return len(objects)
+
+
+def ShiftPressed():
+    state = c4d.BaseContainer()
+    c4d.gui.GetInputState(c4d.BFM_INPUT_KEYBOARD, c4d.BFM_INPUT_CHANNEL, state)
+    return bool(state[c4d.BFM_INPUT_QUALIFIER] & c4d.QSHIFT)
+
+
 def main():
+    objects = doc.GetActiveObjects(c4d.GETACTIVEOBJECTFLAGS_SELECTIONORDER)
+    if len(objects) > 1 or (objects and ShiftPressed()):
+        pattern = None
+        if ShiftPressed():
+            pattern = c4d.gui.InputDialog("Targets naming pattern ({name} = object name)", "{name}_*")
+        doc.StartUndo()
+        ApplyToObjects(objects, pattern)
+        doc.EndUndo()
+        c4d.EventAdd()
+        return
+
     doc.StartUndo()
     selection = doc.GetActiveObject()
     if not selection: